@@ -0,0 +1,76 @@
+"""On-disk cache of parsed migrations keyed by adapter, file path, size and mtime."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+__all__ = ["ParseCache"]
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the parsers' output or MigrationInfo change shape.
+_CACHE_VERSION = 2
+
+
+class ParseCache:
+    """Stores one JSON record per parsed file under *cache_dir*.
+
+    Entries are never invalidated in place: an edited file has a new size or
+    mtime and therefore a new key.  JSON is used instead of pickle so that a
+    cache directory checked into an untrusted repository cannot run code.
+    """
+
+    def __init__(self, cache_dir: Path, kind: str) -> None:
+        self.cache_dir = cache_dir
+        # The adapter that produced the records; the same file parsed by a
+        # different adapter gets a different key.
+        self.kind = kind
+
+    def load(self, path: Path) -> dict[str, Any] | None:
+        entry = self._entry_path(path)
+        if entry is None:
+            return None
+        try:
+            return json.loads(entry.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def store(self, path: Path, record: dict[str, Any]) -> None:
+        entry = self._entry_path(path)
+        if entry is None:
+            return
+        try:
+            self._ensure_dir()
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            logger.debug("Parse cache unavailable at %s", self.cache_dir, exc_info=True)
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(record, fh)
+            os.replace(tmp, entry)
+        except (OSError, TypeError, ValueError):
+            logger.debug("Could not write parse cache entry for %s", path, exc_info=True)
+            Path(tmp).unlink(missing_ok=True)
+
+    def _entry_path(self, path: Path) -> Path | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        digest = hashlib.blake2b(f"{self.kind}\0{path}".encode(), digest_size=16)
+        digest.update(struct.pack("<QqI", st.st_size, st.st_mtime_ns, _CACHE_VERSION))
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    def _ensure_dir(self) -> None:
+        if self.cache_dir.is_dir():
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.cache_dir / ".gitignore").write_text("# Created by migrationiq\n*\n", encoding="utf-8")
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import ast
 import logging
+import os
 import re
+import sys
 from pathlib import Path
 
 from migrationiq.adapters.base import BaseMigrationAdapter, MigrationInfo
@@ -13,10 +15,22 @@ __all__ = ["AlembicAdapter"]
 
 logger = logging.getLogger(__name__)
 
-_REVISION_RE = re.compile(r"""^revision\s*[:=]\s*['"]([^'"]+)['"]""", re.MULTILINE)
-_DOWN_REV_RE = re.compile(r"""^down_revision\s*[:=]\s*['"]([^'"]+)['"]""", re.MULTILINE)
-_DOWN_REV_TUPLE_RE = re.compile(r"""^down_revision\s*[:=]\s*\(([^)]*)\)""", re.MULTILINE)
-_DOWN_REV_NONE_RE = re.compile(r"""^down_revision\s*[:=]\s*None""", re.MULTILINE)
+_REVISION_RE = re.compile(rb"""^revision\s*[:=]\s*['"]([^'"]+)['"]""", re.MULTILINE)
+_DOWN_REV_RE = re.compile(
+    rb"""^down_revision\s*[:=]\s*(?:(?P<none>None)|['"](?P<str>[^'"]+)['"]|\((?P<tuple>[^)]*)\))""",
+    re.MULTILINE,
+)
+_UPGRADE_DEF_RE = re.compile(rb"^def upgrade\(", re.MULTILINE)
+# First column-0 line that can start a top-level statement.  Dedented bracket
+# continuations (``]``, ``}``, ``)``) never end the slice; one that starts
+# with a name leaves the slice unbalanced, so _scan_op_calls bails out.
+_DEDENT_RE = re.compile(rb"^[A-Za-z_@]", re.MULTILINE)
+# ``op.<name>(`` with an optional plain single-line string literal as first argument.
+_OP_CALL_RE = re.compile(rb"""(?<![\w.])op\.(\w+)\(\s*(?:(['"])([^'"\\\n]*)\2(?=\s*[,)]))?""")
+_OP_REF_RE = re.compile(rb"(?<![\w.])op\.")
+_STR_START_RE = re.compile(rb"""[rRuUbBfF]{0,2}['"]""")
+_OP_IN_COMMENT_RE = re.compile(rb"#[^\n]*\bop\.")
+_BRACKETS = ((b"(", b")"), (b"[", b"]"), (b"{", b"}"))
 
 _OP_SQL_MAP: dict[str, str] = {
     "create_table": "CREATE TABLE",
@@ -29,6 +43,8 @@ _OP_SQL_MAP: dict[str, str] = {
     "rename_table": "ALTER TABLE RENAME",
     "execute": "RAW SQL",
 }
+# Shared by every MigrationInfo that carries one of these labels.
+_OP_SQL_MAP = {k: sys.intern(v) for k, v in _OP_SQL_MAP.items()}
 
 
 class AlembicAdapter(BaseMigrationAdapter):
@@ -43,84 +59,154 @@ class AlembicAdapter(BaseMigrationAdapter):
         return any(p.exists() for p in indicators)
 
     def discover_migrations(self) -> list[MigrationInfo]:
-        migrations: list[MigrationInfo] = []
-        versions_dirs = self._find_versions_dirs()
-        for versions_dir in versions_dirs:
-            for py_file in sorted(versions_dir.glob("*.py")):
-                if py_file.name.startswith("__"):
-                    continue
-                try:
-                    info = self._parse_revision_file(py_file)
-                    if info is not None:
-                        migrations.append(info)
-                except Exception:
-                    logger.warning("Failed to parse revision: %s", py_file, exc_info=True)
-        return migrations
+        tasks: list[tuple[Path]] = []
+        for versions_dir in self._find_versions_dirs():
+            for py_file in self._list_py_files(versions_dir):
+                tasks.append((py_file,))
+        return self._parse_all(_parse_worker, tasks)
 
     def _find_versions_dirs(self) -> list[Path]:
         dirs: list[Path] = []
-        for candidate in ("alembic/versions", "migrations/versions", "versions"):
-            d = self.root_dir / candidate
-            if d.is_dir():
-                dirs.append(d)
+        try:
+            with os.scandir(self.root_dir) as it:
+                top = {e.name for e in it if e.is_dir()}
+        except OSError:
+            top = set()
+        for parent in ("alembic", "migrations"):
+            if parent in top and (self.root_dir / parent / "versions").is_dir():
+                dirs.append(self.root_dir / parent / "versions")
+        if "versions" in top:
+            dirs.append(self.root_dir / "versions")
         if not dirs:
-            for env_py in self.root_dir.rglob("env.py"):
-                versions = env_py.parent / "versions"
-                if versions.is_dir():
-                    dirs.append(versions)
+            for d in (str(self.root_dir), *self._iter_project_dirs()):
+                if os.path.isfile(os.path.join(d, "env.py")) and os.path.isdir(os.path.join(d, "versions")):
+                    dirs.append(Path(d, "versions"))
         return dirs
 
-    def _parse_revision_file(self, path: Path) -> MigrationInfo | None:
-        source = path.read_text(encoding="utf-8", errors="replace")
-        revision = self._extract_revision(source)
+    @staticmethod
+    def _parse_revision_file(path: Path, source: bytes | None = None) -> MigrationInfo | None:
+        if source is None:
+            source = path.read_bytes()
+        if b"revision" not in source:
+            return None
+        revision = AlembicAdapter._extract_revision(source)
         if revision is None:
             return None
-        dependencies = self._extract_down_revision(source)
-        operations = self._extract_operations(source, path)
+        dependencies = AlembicAdapter._extract_down_revision(source)
+        operations = AlembicAdapter._extract_operations(source, path)
         return MigrationInfo(
             migration_id=revision, app_label="alembic",
-            dependencies=dependencies, operations=operations,
-            sql_content=source, file_path=path,
+            dependencies=tuple(dependencies), operations=tuple(operations),
+            sql_content=source.decode("utf-8", errors="replace"), file_path=path,
         )
 
     @staticmethod
-    def _extract_revision(source: str) -> str | None:
+    def _extract_revision(source: bytes) -> str | None:
         match = _REVISION_RE.search(source)
-        return match.group(1) if match else None
+        return match.group(1).decode("utf-8", errors="replace") if match else None
 
     @staticmethod
-    def _extract_down_revision(source: str) -> list[str]:
-        if _DOWN_REV_NONE_RE.search(source):
+    def _extract_down_revision(source: bytes) -> list[str]:
+        if b"down_revision" not in source:
             return []
         match = _DOWN_REV_RE.search(source)
-        if match:
-            return [match.group(1)]
-        match = _DOWN_REV_TUPLE_RE.search(source)
-        if match:
-            inner = match.group(1)
-            return [s.strip().strip("'\"") for s in inner.split(",") if s.strip()]
-        return []
+        if match is None or match.group("none"):
+            return []
+        if match.group("str"):
+            return [match.group("str").decode("utf-8", errors="replace")]
+        inner = match.group("tuple").decode("utf-8", errors="replace")
+        return [s.strip().strip("'\"") for s in inner.split(",") if s.strip()]
 
     @staticmethod
-    def _extract_operations(source: str, path: Path) -> list[str]:
+    def _extract_operations(source: bytes, path: Path) -> list[str]:
+        chunk = _upgrade_slice(source)
+        if chunk is not None:
+            scanned = _scan_op_calls(chunk)
+            if scanned is not None:
+                return scanned
         ops: list[str] = []
-        try:
-            tree = ast.parse(source, filename=str(path))
-        except SyntaxError:
+        tree = _parse_upgrade_slice(chunk, path) if chunk is not None else None
+        if tree is None:
+            try:
+                tree = ast.parse(source, filename=str(path))
+            except SyntaxError:
+                return ops
+        upgrade = next((
+            node for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name == "upgrade"
+        ), None)
+        if upgrade is None:
             return ops
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "upgrade":
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call):
-                        call_name = _get_op_call_name(child)
-                        if call_name:
-                            sql_equiv = _OP_SQL_MAP.get(call_name, call_name)
-                            detail = _get_first_str_arg(child)
-                            label = f"{sql_equiv}: {detail}" if detail else sql_equiv
-                            ops.append(label)
+        Call = ast.Call
+        get_name, get_detail = _get_op_call_name, _get_first_str_arg
+        sql_map, intern = _OP_SQL_MAP, sys.intern
+        # Source order, as the regex scan reports them; ast.walk is breadth-first.
+        calls = sorted(
+            (child for child in ast.walk(upgrade) if isinstance(child, Call)),
+            key=lambda call: (call.lineno, call.col_offset),
+        )
+        for child in calls:
+            call_name = get_name(child)
+            if call_name:
+                sql_equiv = sql_map.get(call_name, call_name)
+                detail = get_detail(child)
+                label = f"{sql_equiv}: {detail}" if detail else intern(sql_equiv)
+                ops.append(label)
         return ops
 
 
+def _parse_worker(task: tuple[Path], source: bytes | None = None) -> MigrationInfo | None:
+    (path,) = task
+    try:
+        return AlembicAdapter._parse_revision_file(path, source)
+    except Exception:
+        logger.warning("Failed to parse revision: %s", path, exc_info=True)
+        return None
+
+
+def _upgrade_slice(source: bytes) -> bytes | None:
+    """Return the top-level ``def upgrade(`` block, up to the next top-level statement."""
+    start = _UPGRADE_DEF_RE.search(source)
+    if start is None:
+        return None
+    end = _DEDENT_RE.search(source, start.end())
+    return source[start.start():end.start() if end else len(source)]
+
+
+def _scan_op_calls(chunk: bytes) -> list[str] | None:
+    """Collect ``op.*`` labels with a regex, or return ``None`` when only the AST can be trusted.
+
+    Bails out on triple-quoted strings, commented-out ``op.`` calls, string
+    literals the pattern cannot capture exactly (prefixes, escapes,
+    concatenation), any ``op.`` reference that is not a plain call, and a
+    slice that may have been cut short (unbalanced brackets, a backslash
+    continuation).
+    """
+    if b'"""' in chunk or b"'''" in chunk or _OP_IN_COMMENT_RE.search(chunk):
+        return None
+    if b"\\\n" in chunk or any(chunk.count(o) != chunk.count(c) for o, c in _BRACKETS):
+        return None
+    ops: list[str] = []
+    for match in _OP_CALL_RE.finditer(chunk):
+        if match.group(2) is None and _STR_START_RE.match(chunk, match.end()):
+            return None
+        call_name = match.group(1).decode("ascii")
+        sql_equiv = _OP_SQL_MAP.get(call_name, call_name)
+        detail = match.group(3).decode("utf-8", errors="replace") if match.group(3) else ""
+        ops.append(f"{sql_equiv}: {detail}" if detail else sys.intern(sql_equiv))
+    if len(ops) != len(_OP_REF_RE.findall(chunk)):
+        return None
+    return ops
+
+
+def _parse_upgrade_slice(chunk: bytes, path: Path) -> ast.Module | None:
+    """Parse just the ``upgrade`` block, or return ``None`` to request a full parse."""
+    try:
+        return ast.parse(chunk, filename=str(path))
+    except SyntaxError:
+        return None
+
+
 def _get_op_call_name(node: ast.Call) -> str | None:
     if isinstance(node.func, ast.Attribute):
         value = node.func.value
@@ -128,6 +214,7 @@ def _get_op_call_name(node: ast.Call) -> str | None:
             return node.func.attr
     return None
 
+
 def _get_first_str_arg(node: ast.Call) -> str:
     if node.args:
         first = node.args[0]
@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
 from pathlib import Path
+from typing import Any
 
+from migrationiq.adapters._parse_cache import ParseCache
 
 __all__ = ["MigrationInfo", "BaseMigrationAdapter"]
 
+# Below this many files the process pool start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 32
+_POOL_CHUNKSIZE = 16
+_READ_AHEAD_WORKERS = 32
 
-@dataclass(frozen=True)
+# Directories that never contain project code but can be huge.  Names a
+# project may use for a real app (``build``, ``dist``) are not pruned.
+_PRUNED_DIRS: frozenset[str] = frozenset({
+    ".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class MigrationInfo:
     """Normalized representation of a single migration file."""
 
     migration_id: str
     app_label: str
-    dependencies: list[str] = field(default_factory=list)
-    operations: list[str] = field(default_factory=list)
+    dependencies: tuple[str, ...] = ()
+    operations: tuple[str, ...] = ()
     sql_content: str = ""
     file_path: Path | None = None
 
@@ -25,8 +44,10 @@ class MigrationInfo:
 class BaseMigrationAdapter(ABC):
     """Interface that each migration framework adapter must implement."""
 
-    def __init__(self, root_dir: Path) -> None:
+    def __init__(self, root_dir: Path, cache_dir: Path | None = None, workers: int = 1) -> None:
         self.root_dir = root_dir.resolve()
+        self.cache_dir = cache_dir
+        self.workers = workers
 
     @abstractmethod
     def discover_migrations(self) -> list[MigrationInfo]:
@@ -35,3 +56,125 @@ class BaseMigrationAdapter(ABC):
     @abstractmethod
     def detect_framework(self) -> bool:
         """Return ``True`` if this adapter's framework is present in the project."""
+
+    def _iter_project_dirs(self) -> Iterator[str]:
+        """Yield every directory below ``root_dir`` with ``os.scandir``, pruning well-known non-source trees.
+
+        Siblings are yielded in sorted order before any of them is descended into.
+        """
+        stack = [str(self.root_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    subdirs = [
+                        entry.path for entry in it
+                        if entry.name not in _PRUNED_DIRS and entry.is_dir(follow_symlinks=False)
+                    ]
+            except OSError:
+                continue
+            subdirs.sort()
+            yield from subdirs
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def _list_py_files(directory: Path) -> list[Path]:
+        """Return the sorted ``*.py`` files in *directory*, skipping dunder modules such as ``__init__.py``."""
+        try:
+            with os.scandir(directory) as it:
+                names = [
+                    e.name for e in it
+                    if e.name.endswith(".py") and not e.name.startswith("__") and e.is_file()
+                ]
+        except OSError:
+            return []
+        names.sort()
+        return [Path(directory, name) for name in names]
+
+    def _parse_all(
+        self,
+        worker: Callable[..., MigrationInfo | None],
+        tasks: Sequence[tuple],
+    ) -> list[MigrationInfo]:
+        """Run *worker* over every ``(path, ...)`` task not already in the parse cache.
+
+        *worker* must be a module-level function so it can be pickled.
+        Results keep the order of *tasks*; ``None`` results are dropped.
+        """
+        cache = ParseCache(self.cache_dir, type(self).__name__) if self.cache_dir is not None else None
+        results: list[MigrationInfo | None] = [None] * len(tasks)
+        pending: list[int] = []
+        for i, task in enumerate(tasks):
+            record = cache.load(task[0]) if cache is not None else None
+            if record is None:
+                pending.append(i)
+            else:
+                results[i] = _from_record(record, task[0])
+        parsed = _run_workers(worker, [tasks[i] for i in pending], self.workers)
+        for i, info in zip(pending, parsed):
+            results[i] = info
+            if cache is not None and info is not None:
+                cache.store(tasks[i][0], _to_record(info))
+        return [info for info in results if info is not None]
+
+
+def _run_workers(
+    worker: Callable[..., MigrationInfo | None],
+    tasks: Sequence[tuple],
+    workers: int,
+) -> list[MigrationInfo | None]:
+    """Serial with threaded read-ahead, or a pool of *workers* processes for large batches.
+
+    On the serial path each file's bytes are passed as the worker's second
+    argument.
+    """
+    if workers < 2 or len(tasks) < _PARALLEL_MIN_FILES:
+        sources = _read_ahead([task[0] for task in tasks])
+        return [worker(task, source) for task, source in zip(tasks, sources)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+        return list(executor.map(worker, tasks, chunksize=_POOL_CHUNKSIZE))
+
+
+def _pool_context() -> BaseContext | None:
+    """Start method for process pools, which may be created from worker threads.
+
+    ``fork`` from a multi-threaded process can deadlock, so use ``forkserver``
+    where it exists; elsewhere the platform default is already ``spawn``.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+def _to_record(info: MigrationInfo) -> dict[str, Any]:
+    return {
+        "migration_id": info.migration_id, "app_label": info.app_label,
+        "dependencies": info.dependencies, "operations": info.operations,
+        "sql_content": info.sql_content,
+    }
+
+
+def _from_record(record: dict[str, Any], path: Path) -> MigrationInfo:
+    return MigrationInfo(
+        migration_id=record["migration_id"], app_label=record["app_label"],
+        dependencies=tuple(record["dependencies"]), operations=tuple(record["operations"]),
+        sql_content=record["sql_content"], file_path=path,
+    )
+
+
+def _read_ahead(paths: Sequence[Path]) -> Iterator[bytes | None]:
+    """Yield the bytes of each file in order while later files are still being read.
+
+    Unreadable files yield ``None``; the worker then re-reads them itself
+    and reports the error through its usual path.
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=min(_READ_AHEAD_WORKERS, len(paths))) as executor:
+        yield from executor.map(_read_or_none, paths)
+
+
+def _read_or_none(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
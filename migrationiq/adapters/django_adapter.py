@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import ast
 import logging
+import os
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 from migrationiq.adapters.base import BaseMigrationAdapter, MigrationInfo
@@ -27,92 +30,108 @@ _OPERATION_SQL_MAP: dict[str, str] = {
     "RunSQL": "RAW SQL",
     "RunPython": "RUN PYTHON",
 }
+# Shared by every MigrationInfo that carries one of these labels.
+_OPERATION_SQL_MAP = {k: sys.intern(v) for k, v in _OPERATION_SQL_MAP.items()}
 
 
 class DjangoAdapter(BaseMigrationAdapter):
     """Adapter that discovers and parses Django migration files via AST."""
 
+    def __init__(self, root_dir: Path, cache_dir: Path | None = None, workers: int = 1) -> None:
+        super().__init__(root_dir, cache_dir, workers)
+        self._migration_dirs: list[Path] | None = None
+
     def detect_framework(self) -> bool:
-        indicators = [
-            self.root_dir / "manage.py",
-            self.root_dir / "settings.py",
-        ]
-        has_migrations_dir = any(self.root_dir.rglob("migrations/__init__.py"))
-        return any(p.exists() for p in indicators) or has_migrations_dir
+        if (self.root_dir / "manage.py").exists() or (self.root_dir / "settings.py").exists():
+            return True
+        if self._migration_dirs is not None:
+            return bool(self._migration_dirs)
+        return next(self._iter_migration_dirs(), None) is not None
 
     def discover_migrations(self) -> list[MigrationInfo]:
-        migrations: list[MigrationInfo] = []
-        for init_file in self.root_dir.rglob("migrations/__init__.py"):
-            migrations_dir = init_file.parent
-            app_label = migrations_dir.parent.name
-            for py_file in sorted(migrations_dir.glob("*.py")):
-                if py_file.name == "__init__.py":
-                    continue
-                try:
-                    info = self._parse_migration_file(py_file, app_label)
-                    if info is not None:
-                        migrations.append(info)
-                except Exception:
-                    logger.warning("Failed to parse migration: %s", py_file, exc_info=True)
-        return migrations
-
-    def _parse_migration_file(self, path: Path, app_label: str) -> MigrationInfo | None:
-        source = path.read_text(encoding="utf-8", errors="replace")
+        tasks: list[tuple[Path, str]] = []
+        for migrations_dir in self._find_migration_dirs():
+            app_label = sys.intern(migrations_dir.parent.name)
+            for py_file in self._list_py_files(migrations_dir):
+                tasks.append((py_file, app_label))
+        return self._parse_all(_parse_worker, tasks)
+
+    def _find_migration_dirs(self) -> list[Path]:
+        if self._migration_dirs is None:
+            self._migration_dirs = list(self._iter_migration_dirs())
+        return self._migration_dirs
+
+    def _iter_migration_dirs(self) -> Iterator[Path]:
+        for d in self._iter_project_dirs():
+            if os.path.basename(d) == "migrations" and os.path.isfile(os.path.join(d, "__init__.py")):
+                yield Path(d)
+
+    @staticmethod
+    def _parse_migration_file(path: Path, app_label: str, source: bytes | None = None) -> MigrationInfo | None:
+        if source is None:
+            source = path.read_bytes()
+        if b"class Migration" not in source:
+            return None
         try:
             tree = ast.parse(source, filename=str(path))
         except SyntaxError:
             logger.warning("Syntax error in %s – skipping", path)
             return None
-        migration_class = self._find_migration_class(tree)
+        migration_class = DjangoAdapter._find_migration_class(tree)
         if migration_class is None:
             return None
         migration_id = f"{app_label}.{path.stem}"
-        dependencies = self._extract_dependencies(migration_class)
-        operations = self._extract_operations(migration_class)
+        dependencies, operations = DjangoAdapter._extract_class_body(migration_class)
         return MigrationInfo(
             migration_id=migration_id, app_label=app_label,
-            dependencies=dependencies, operations=operations,
-            sql_content=source, file_path=path,
+            dependencies=tuple(dependencies), operations=tuple(operations),
+            sql_content=source.decode("utf-8", errors="replace"), file_path=path,
         )
 
     @staticmethod
     def _find_migration_class(tree: ast.Module) -> ast.ClassDef | None:
-        for node in ast.walk(tree):
+        for node in tree.body:
             if isinstance(node, ast.ClassDef) and node.name == "Migration":
                 return node
         return None
 
     @staticmethod
-    def _extract_dependencies(cls_node: ast.ClassDef) -> list[str]:
+    def _extract_class_body(cls_node: ast.ClassDef) -> tuple[list[str], list[str]]:
+        Assign, Name, List, Tuple = ast.Assign, ast.Name, ast.List, ast.Tuple
+        get_str, get_name, get_detail = _ast_str, _extract_call_name, _extract_operation_detail
+        sql_map, intern = _OPERATION_SQL_MAP, sys.intern
         deps: list[str] = []
-        for node in cls_node.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == "dependencies":
-                        if isinstance(node.value, ast.List):
-                            for elt in node.value.elts:
-                                if isinstance(elt, ast.Tuple) and len(elt.elts) >= 2:
-                                    app = _ast_str(elt.elts[0])
-                                    name = _ast_str(elt.elts[1])
-                                    if app and name:
-                                        deps.append(f"{app}.{name}")
-        return deps
-
-    @staticmethod
-    def _extract_operations(cls_node: ast.ClassDef) -> list[str]:
         ops: list[str] = []
         for node in cls_node.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name) and target.id == "operations":
-                        if isinstance(node.value, ast.List):
-                            for elt in node.value.elts:
-                                op_name = _extract_call_name(elt)
-                                sql_equiv = _OPERATION_SQL_MAP.get(op_name, op_name)
-                                detail = _extract_operation_detail(elt, op_name)
-                                label = f"{sql_equiv}: {detail}" if detail else sql_equiv
-                                ops.append(label)
-        return ops
+            if not isinstance(node, Assign) or not isinstance(node.value, List):
+                continue
+            for target in node.targets:
+                if not isinstance(target, Name):
+                    continue
+                if target.id == "dependencies":
+                    for elt in node.value.elts:
+                        if isinstance(elt, Tuple) and len(elt.elts) >= 2:
+                            app = get_str(elt.elts[0])
+                            name = get_str(elt.elts[1])
+                            if app and name:
+                                deps.append(f"{app}.{name}")
+                elif target.id == "operations":
+                    for elt in node.value.elts:
+                        op_name = get_name(elt)
+                        sql_equiv = sql_map.get(op_name, op_name)
+                        detail = get_detail(elt, op_name)
+                        label = f"{sql_equiv}: {detail}" if detail else intern(sql_equiv)
+                        ops.append(label)
+        return deps, ops
+
+
+def _parse_worker(task: tuple[Path, str], source: bytes | None = None) -> MigrationInfo | None:
+    path, app_label = task
+    try:
+        return DjangoAdapter._parse_migration_file(path, app_label, source)
+    except Exception:
+        logger.warning("Failed to parse migration: %s", path, exc_info=True)
+        return None
 
 
 def _ast_str(node: ast.expr) -> str | None:
@@ -120,6 +139,7 @@ def _ast_str(node: ast.expr) -> str | None:
         return node.value
     return None
 
+
 def _extract_call_name(node: ast.expr) -> str:
     if not isinstance(node, ast.Call):
         return "Unknown"
@@ -130,6 +150,7 @@ def _extract_call_name(node: ast.expr) -> str:
         return func.id
     return "Unknown"
 
+
 def _extract_operation_detail(node: ast.expr, op_name: str) -> str:
     if not isinstance(node, ast.Call):
         return ""
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
+import importlib
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-
-from migrationiq.config.settings import load_settings
-from migrationiq.core.engine import MigrationIQEngine
-from migrationiq.core.risk_scoring import Severity
-from migrationiq.utils.logger import (
-    console, print_error, print_info, print_success, print_warning,
-)
+
+if TYPE_CHECKING:
+    from migrationiq.core.engine import MigrationIQEngine
 
 __all__ = ["app"]
 
+# Heavy modules (pydantic, yaml, rich, the engine) are imported inside the
+# commands so that ``--help`` and shell completion only pay for Typer.
+_LAZY_ATTRS: dict[str, str] = {
+    "MigrationIQEngine": "migrationiq.core.engine",
+    "load_settings": "migrationiq.config.settings",
+    "Severity": "migrationiq.core.risk_scoring",
+    "console": "migrationiq.utils.logger",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
 app = typer.Typer(
     name="migrationiq",
     help="Git-aware migration safety CLI for Django and Alembic projects.",
@@ -29,6 +40,9 @@ app = typer.Typer(
 
 
 def _load_engine(config: Path | None, project_dir: Path | None, framework: str | None) -> MigrationIQEngine:
+    from migrationiq.config.settings import load_settings
+    from migrationiq.core.engine import MigrationIQEngine
+
     root = (project_dir or Path.cwd()).resolve()
     settings = load_settings(config_path=config, search_dir=root)
     if framework:
@@ -40,6 +54,11 @@ _SEVERITY_COLOR = {"CRITICAL": "bold red", "ERROR": "red", "WARNING": "yellow",
 
 
 def _banner() -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
+    from migrationiq.utils.logger import console
+
     console.print(Panel(
         Text("MigrationIQ", style="bold magenta", justify="center"),
         subtitle="Git-aware migration safety",
@@ -55,6 +74,11 @@ def check(
     framework: Optional[str] = typer.Option(None, "--framework", "-f", help="Migration framework: django|alembic|auto"),
 ) -> None:
     """Build migration graph and detect structural issues."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from migrationiq.utils.logger import console, print_error, print_success, print_warning
+
     _banner()
     engine = _load_engine(config, project_dir, framework)
     with console.status("[bold cyan]Analysing migration graph…"):
@@ -75,9 +99,10 @@ def check(
     table.add_column("Severity")
     table.add_column("Description")
     table.add_column("Nodes")
+    add_row = table.add_row
     for issue in result.graph_issues:
         sev_style = "red" if issue.severity == "critical" else "yellow"
-        table.add_row(issue.issue_type, f"[{sev_style}]{issue.severity.upper()}[/{sev_style}]", issue.description, ", ".join(issue.nodes[:5]))
+        add_row(issue.issue_type, f"[{sev_style}]{issue.severity.upper()}[/{sev_style}]", issue.description, ", ".join(issue.nodes[:5]))
     console.print(table)
 
     if result.has_critical:
@@ -92,10 +117,20 @@ def lint(
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to migrationiq.yaml"),
     project_dir: Optional[Path] = typer.Option(None, "--dir", "-d", help="Project root directory"),
     framework: Optional[str] = typer.Option(None, "--framework", "-f", help="Migration framework: django|alembic|auto"),
+    numprocesses: Optional[int] = typer.Option(None, "--numprocesses", "-n", help="Evaluate rules in N worker processes"),
 ) -> None:
     """Parse migration files and detect risky operations."""
+    from rich.console import Group
+    from rich.panel import Panel
+
+    from migrationiq.rules.base_rule import ViolationSeverity
+    from migrationiq.utils.logger import console, print_success
+
     _banner()
     engine = _load_engine(config, project_dir, framework)
+    if numprocesses is not None:
+        engine.settings.parallel = numprocesses > 1
+        engine.settings.numprocesses = numprocesses
     with console.status("[bold cyan]Linting migration files…"):
         result = engine.run_lint()
 
@@ -107,24 +142,29 @@ def lint(
     for v in result.violations:
         by_file.setdefault(v.file_path or "<unknown>", []).append(v)
 
+    # One Group per file: Rich lays out and flushes once instead of per line.
     for file_path, violations in by_file.items():
-        console.print(Panel(f"[bold]{file_path}[/bold]  ({len(violations)} issue(s))", border_style="yellow", expand=True))
+        items: list[Any] = [Panel(f"[bold]{file_path}[/bold]  ({len(violations)} issue(s))", border_style="yellow", expand=True)]
+        add = items.append
         for v in violations:
-            style = _SEVERITY_COLOR.get(v.severity.value, "white")
-            console.print(f"  [{style}]● {v.severity.value}[/{style}]  {v.message}")
+            sev_val = v.severity.value
+            style = _SEVERITY_COLOR.get(sev_val, "white")
+            add(f"  [{style}]● {sev_val}[/{style}]  {v.message}")
             if v.line_hint:
-                console.print(f"    [dim]Line ~{v.line_hint}[/dim]")
-            console.print(f"    [dim]Why risky:[/dim] {v.explanation}")
-            console.print(f"    [dim]Suggested fix:[/dim] {v.suggested_fix}")
+                add(f"    [dim]Line ~{v.line_hint}[/dim]")
+            add(f"    [dim]Why risky:[/dim] {v.explanation}")
+            add(f"    [dim]Suggested fix:[/dim] {v.suggested_fix}")
             if v.example_snippet:
-                console.print(f"    [dim]Example:[/dim]")
-                console.print(Panel(v.example_snippet, border_style="dim", expand=False))
-            console.print()
+                add("    [dim]Example:[/dim]")
+                add(Panel(v.example_snippet, border_style="dim", expand=False))
+            add("")
+        console.print(Group(*items))
 
     total = len(result.violations)
-    crits = sum(1 for v in result.violations if v.severity.value == "CRITICAL")
-    errs = sum(1 for v in result.violations if v.severity.value == "ERROR")
-    warns = sum(1 for v in result.violations if v.severity.value == "WARNING")
+    counts = Counter(v.severity for v in result.violations)
+    crits = counts[ViolationSeverity.CRITICAL]
+    errs = counts[ViolationSeverity.ERROR]
+    warns = counts[ViolationSeverity.WARNING]
     console.print(Panel(
         f"[bold]Total: {total}[/bold]  [red]Critical: {crits}[/red]  [red]Error: {errs}[/red]  [yellow]Warning: {warns}[/yellow]",
         title="📋 Lint Summary", border_style="cyan",
@@ -140,6 +180,11 @@ def compare(
     framework: Optional[str] = typer.Option(None, "--framework", "-f", help="Migration framework"),
 ) -> None:
     """Compare migration graph between current branch and target."""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from migrationiq.utils.logger import console, print_error, print_success, print_warning
+
     _banner()
     engine = _load_engine(config, project_dir, framework)
     with console.status(f"[bold cyan]Comparing with {target}…"):
@@ -195,6 +240,8 @@ def ready(
     framework: Optional[str] = typer.Option(None, "--framework", "-f", help="Migration framework"),
 ) -> None:
     """Run full pre-PR readiness check (compare + check + lint)."""
+    from migrationiq.utils.logger import console
+
     _banner()
     engine = _load_engine(config, project_dir, framework)
     with console.status("[bold cyan]Running full readiness check…"):
@@ -212,6 +259,11 @@ def protect(
     framework: Optional[str] = typer.Option(None, "--framework", "-f", help="Migration framework"),
 ) -> None:
     """Run readiness check and enforce risk threshold (for CI)."""
+    from rich.panel import Panel
+
+    from migrationiq.core.risk_scoring import Severity
+    from migrationiq.utils.logger import console, print_error, print_success
+
     _banner()
     engine = _load_engine(config, project_dir, framework)
     with console.status("[bold cyan]Running protection check…"):
@@ -235,20 +287,27 @@ def protect(
 
 
 def _print_ready_report(check, lint, compare, risk) -> None:
+    from rich.console import Group
+    from rich.table import Table
+
+    from migrationiq.utils.logger import console
+
     console.rule("[bold cyan]Migration Graph Check")
-    console.print(f"  Migrations discovered: {len(check.migrations)}")
-    console.print(f"  Graph issues: {len(check.graph_issues)}")
+    lines = [f"  Migrations discovered: {len(check.migrations)}", f"  Graph issues: {len(check.graph_issues)}"]
     for issue in check.graph_issues:
         sev_style = "red" if issue.severity == "critical" else "yellow"
-        console.print(f"    [{sev_style}]● {issue.severity.upper()}[/{sev_style}] {issue.description}")
-    console.print()
+        lines.append(f"    [{sev_style}]● {issue.severity.upper()}[/{sev_style}] {issue.description}")
+    lines.append("")
+    console.print(Group(*lines))
 
     console.rule("[bold cyan]Migration Lint")
-    console.print(f"  Violations: {len(lint.violations)}")
+    lines = [f"  Violations: {len(lint.violations)}"]
     for v in lint.violations:
-        style = _SEVERITY_COLOR.get(v.severity.value, "white")
-        console.print(f"    [{style}]● {v.severity.value}[/{style}] {v.message}")
-    console.print()
+        sev_val = v.severity.value
+        style = _SEVERITY_COLOR.get(sev_val, "white")
+        lines.append(f"    [{style}]● {sev_val}[/{style}] {v.message}")
+    lines.append("")
+    console.print(Group(*lines))
 
     if compare:
         console.rule("[bold cyan]Branch Comparison")
@@ -268,8 +327,9 @@ def _print_ready_report(check, lint, compare, risk) -> None:
         table.add_column("Score", justify="center")
         table.add_column("Description")
         table.add_column("File")
+        add_row = table.add_row
         for f in risk.findings:
-            table.add_row(f.category, str(f.score), f.description, f.file_path)
+            add_row(f.category, str(f.score), f.description, f.file_path)
         console.print(table)
         console.print()
 
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 __all__ = ["RulesConfig", "MigrationIQSettings", "load_settings"]
 
@@ -19,6 +27,7 @@ _CONFIG_FILE_NAMES: list[str] = [
     "migrasafe.yaml",
     "migrasafe.yml",
 ]
+_CONFIG_FILE_SET: frozenset[str] = frozenset(_CONFIG_FILE_NAMES)
 
 
 class RulesConfig(BaseModel):
@@ -61,6 +70,22 @@ class MigrationIQSettings(BaseModel):
         default="auto",
         description="Migration framework: 'django', 'alembic', or 'auto' for detection.",
     )
+    cache_dir: str | None = Field(
+        default=None,
+        description="Directory, relative to the project root, for cached parse results, e.g. '.migrationiq_cache'. Off when null.",
+    )
+    git_backend: str = Field(
+        default="auto",
+        description="Git backend: 'subprocess', 'libgit2', or 'auto' to use libgit2 when pygit2 is installed.",
+    )
+    parallel: bool = Field(
+        default=False,
+        description="Parse migrations and evaluate lint rules in worker processes.",
+    )
+    numprocesses: int | None = Field(
+        default=None,
+        description="Number of worker processes when parallel is on; defaults to the CPU count.",
+    )
     rules: RulesConfig = Field(
         default_factory=RulesConfig,
         description="Per-rule configuration.",
@@ -71,10 +96,10 @@ def _find_config_file(search_dir: Path) -> Path | None:
     """Walk up from *search_dir* looking for a config file."""
     current = search_dir.resolve()
     while True:
+        present = _config_files_in(current)
         for name in _CONFIG_FILE_NAMES:
-            candidate = current / name
-            if candidate.is_file():
-                return candidate
+            if name in present:
+                return current / name
         parent = current.parent
         if parent == current:
             break
@@ -82,20 +107,45 @@ def _find_config_file(search_dir: Path) -> Path | None:
     return None
 
 
+def _config_files_in(directory: Path) -> set[str]:
+    """Return the config file names present in *directory* using a single scandir."""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it if e.name in _CONFIG_FILE_SET and e.is_file()}
+    except OSError:
+        return set()
+
+
+def _load_raw(config_path: Path | None, search_dir: Path | None) -> dict[str, Any]:
+    path = config_path if config_path is not None else _find_config_file(search_dir or Path.cwd())
+    if path is None:
+        return {}
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    if not stat.S_ISREG(st.st_mode):
+        return {}
+    return _read_yaml(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    # Keyed on mtime and size so a config file edited mid-process is re-read.
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+
+
 def load_settings(
     config_path: Path | None = None,
     search_dir: Path | None = None,
 ) -> MigrationIQSettings:
-    """Load settings from a YAML file, falling back to defaults."""
-    raw: dict[str, Any] = {}
+    """Load settings from a YAML file, falling back to defaults.
 
+    Parsed files are cached until they change on disk; each call still
+    returns a fresh settings object that callers may modify.
+    """
     if config_path is not None:
-        resolved = Path(config_path).resolve()
-        if resolved.is_file():
-            raw = yaml.safe_load(resolved.read_text(encoding="utf-8")) or {}
+        raw = _load_raw(Path(config_path).resolve(), None)
     else:
-        found = _find_config_file(search_dir or Path.cwd())
-        if found is not None:
-            raw = yaml.safe_load(found.read_text(encoding="utf-8")) or {}
-
+        raw = _load_raw(None, (search_dir or Path.cwd()).resolve())
     return MigrationIQSettings(**raw)
@@ -0,0 +1,119 @@
+"""Numba-compiled MigrationGraph kernels over CSR arrays (``pip install "migrationiq[numba]"``).
+
+Importing this module raises ``ImportError`` when numba is not installed;
+:mod:`migrationiq.core.migration_graph` then keeps its pure-Python loops.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+import numpy as np
+from numba import njit
+
+__all__ = ["topological_order", "strongly_connected"]
+
+
+def topological_order(fwd_ptr: Sequence[int], rev_ptr: Sequence[int], rev_idx: array) -> list[int]:
+    """Kahn's algorithm; returns fewer than ``n`` ids when the graph has a cycle."""
+    order = _kahn(_int32(fwd_ptr), _int32(rev_ptr), _int32(rev_idx))
+    return order.tolist()
+
+
+def strongly_connected(fwd_ptr: Sequence[int], fwd_idx: array) -> list[list[int]]:
+    """Tarjan's SCCs, each as its member ids, in the order the pure-Python pass emits them."""
+    members, bounds = _tarjan(_int32(fwd_ptr), _int32(fwd_idx))
+    members_list, bounds_list = members.tolist(), bounds.tolist()
+    return [members_list[bounds_list[i]:bounds_list[i + 1]] for i in range(len(bounds_list) - 1)]
+
+
+def _int32(values: Sequence[int] | array) -> np.ndarray:
+    if isinstance(values, array):
+        return np.frombuffer(values, dtype=np.int32) if len(values) else np.zeros(0, np.int32)
+    return np.asarray(values, dtype=np.int32)
+
+
+@njit(cache=True)
+def _kahn(fwd_ptr, rev_ptr, rev_idx):
+    n = fwd_ptr.shape[0] - 1
+    in_degree = np.empty(n, np.int32)
+    queue = np.empty(n, np.int32)
+    tail = 0
+    for i in range(n):
+        in_degree[i] = fwd_ptr[i + 1] - fwd_ptr[i]
+        if in_degree[i] == 0:
+            queue[tail] = i
+            tail += 1
+    head = 0
+    while head < tail:
+        node = queue[head]
+        head += 1
+        for k in range(rev_ptr[node], rev_ptr[node + 1]):
+            dependent = rev_idx[k]
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue[tail] = dependent
+                tail += 1
+    return queue[:tail]
+
+
+@njit(cache=True)
+def _tarjan(fwd_ptr, fwd_idx):
+    n = fwd_ptr.shape[0] - 1
+    index = np.full(n, -1, np.int32)
+    lowlink = np.zeros(n, np.int32)
+    on_stack = np.zeros(n, np.bool_)
+    next_edge = fwd_ptr[:-1].copy()
+    stack = np.empty(n, np.int32)
+    work = np.empty(n, np.int32)
+    members = np.empty(n, np.int32)
+    bounds = np.zeros(n + 1, np.int32)
+    sp = 0
+    emitted = 0
+    ncomp = 0
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = counter
+        lowlink[root] = counter
+        counter += 1
+        stack[sp] = root
+        sp += 1
+        on_stack[root] = True
+        work[0] = root
+        wp = 1
+        while wp > 0:
+            node = work[wp - 1]
+            pos = next_edge[node]
+            if pos < fwd_ptr[node + 1]:
+                next_edge[node] = pos + 1
+                child = fwd_idx[pos]
+                if index[child] == -1:
+                    index[child] = counter
+                    lowlink[child] = counter
+                    counter += 1
+                    stack[sp] = child
+                    sp += 1
+                    on_stack[child] = True
+                    work[wp] = child
+                    wp += 1
+                elif on_stack[child] and index[child] < lowlink[node]:
+                    lowlink[node] = index[child]
+                continue
+            wp -= 1
+            if wp > 0 and lowlink[node] < lowlink[work[wp - 1]]:
+                lowlink[work[wp - 1]] = lowlink[node]
+            if lowlink[node] == index[node]:
+                while True:
+                    sp -= 1
+                    member = stack[sp]
+                    on_stack[member] = False
+                    members[emitted] = member
+                    emitted += 1
+                    if member == node:
+                        break
+                ncomp += 1
+                bounds[ncomp] = emitted
+    return members, bounds[:ncomp + 1]
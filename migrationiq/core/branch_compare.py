@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -9,15 +11,20 @@ from migrationiq.git.git_utils import GitClient
 
 __all__ = ["ComparisonReport", "BranchComparator"]
 
+# Independent read-only git queries run side by side; each is its own process.
+_GIT_QUERY_WORKERS = 4
+# A .py file anywhere below a "migrations" or "versions" directory.
+_MIGRATION_PATH_RE = re.compile(r"(?:^|/)(?:migrations|versions)/.*\.py$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class BranchDelta:
     file_path: str
     status: str
     branch: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonReport:
     current_branch: str = ""
     target_branch: str = ""
@@ -42,16 +49,23 @@ class BranchComparator:
     def compare(self, target_branch: str) -> ComparisonReport:
         report = ComparisonReport(target_branch=target_branch)
         self.git.fetch()
-        report.current_branch = self.git.current_branch()
-        merge_base = self.git.merge_base(report.current_branch, target_branch)
-        if not merge_base:
-            report.suggestions.append("Could not determine merge base. Ensure both branches share a common ancestor.")
-            return report
-        behind = self.git.commits_between(merge_base, target_branch)
+        # Queries are made against HEAD so none of them waits on current_branch().
+        with ThreadPoolExecutor(max_workers=_GIT_QUERY_WORKERS) as executor:
+            branch_f = executor.submit(self.git.current_branch)
+            merge_base_f = executor.submit(self.git.merge_base, "HEAD", target_branch)
+            counts_f = executor.submit(self.git.rev_list_leftright, "HEAD", target_branch)
+            report.current_branch = branch_f.result()
+            merge_base = merge_base_f.result()
+            if not merge_base:
+                report.suggestions.append("Could not determine merge base. Ensure both branches share a common ancestor.")
+                return report
+            current_f = executor.submit(self._migration_files_in_diff, merge_base, "HEAD")
+            target_f = executor.submit(self._migration_files_in_diff, merge_base, target_branch)
+            _, behind = counts_f.result()
+            current_files = current_f.result()
+            target_files = target_f.result()
         report.commits_behind = behind
         report.is_behind = behind > 0
-        current_files = self._migration_files_in_diff(merge_base, report.current_branch)
-        target_files = self._migration_files_in_diff(merge_base, target_branch)
         report.current_only = sorted(current_files - target_files)
         report.target_only = sorted(target_files - current_files)
         report.parallel_migrations = sorted(current_files & target_files)
@@ -59,19 +73,12 @@ class BranchComparator:
         return report
 
     def _migration_files_in_diff(self, base_ref: str, head_ref: str) -> set[str]:
-        all_files = self.git.diff_files(base_ref, head_ref)
-        return {f for f in all_files if self._is_migration_file(f)}
+        search = _MIGRATION_PATH_RE.search
+        return {f for f in self.git.iter_diff_files(base_ref, head_ref) if search(f.replace("\\", "/"))}
 
     @staticmethod
     def _is_migration_file(path: str) -> bool:
-        parts = path.replace("\\", "/").split("/")
-        if not path.endswith(".py"):
-            return False
-        if "migrations" in parts:
-            return True
-        if "versions" in parts:
-            return True
-        return False
+        return _MIGRATION_PATH_RE.search(path.replace("\\", "/")) is not None
 
     @staticmethod
     def _generate_suggestions(report: ComparisonReport) -> None:
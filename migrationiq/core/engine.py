@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from migrationiq.adapters.base import BaseMigrationAdapter, MigrationInfo
+from migrationiq.adapters.base import BaseMigrationAdapter, MigrationInfo, _pool_context
 from migrationiq.adapters.django_adapter import DjangoAdapter
 from migrationiq.adapters.alembic_adapter import AlembicAdapter
 from migrationiq.core.migration_graph import MigrationGraph, GraphIssue
@@ -18,13 +24,21 @@ from migrationiq.rules.drop_column_rule import DropColumnRule
 from migrationiq.rules.non_null_rule import NonNullRule
 from migrationiq.rules.type_change_rule import TypeChangeRule
 from migrationiq.rules.multiple_heads_rule import MultipleHeadsRule
-from migrationiq.git.git_utils import GitClient
+from migrationiq.rules.scanner import scan_all, scan_by_rule
+from migrationiq.git.git_utils import create_git_client
 
 __all__ = ["MigrationIQEngine", "CheckResult", "LintResult", "ReadyResult", "ProtectResult"]
 
+# Rules are rebuilt from their ids inside lint worker processes.
+_RULE_TYPES: dict[str, type[BaseRule]] = {
+    cls.rule_id: cls for cls in (DropTableRule, DropColumnRule, NonNullRule, TypeChangeRule, MultipleHeadsRule)
+}
+# Chunks per worker, so one slow chunk does not leave the other workers idle.
+_CHUNKS_PER_WORKER = 4
+
 
 class CheckResult:
-    def __init__(self, migrations: list[MigrationInfo], graph_issues: list[GraphIssue], heads: list[str], roots: list[str]) -> None:
+    def __init__(self, migrations: list[MigrationInfo], graph_issues: list[GraphIssue], heads: tuple[str, ...], roots: tuple[str, ...]) -> None:
         self.migrations = migrations
         self.graph_issues = graph_issues
         self.heads = heads
@@ -102,27 +116,43 @@ class MigrationIQEngine:
 
     def __init__(self, settings: MigrationIQSettings, root_dir: Path | None = None) -> None:
         self.settings = settings
-        self.root_dir = (root_dir or Path.cwd()).resolve()
+        self._root_dir_raw = root_dir
         self._adapter: BaseMigrationAdapter | None = None
+        self._adapter_lock = threading.Lock()
+        # (migrations, graph) shared by the check and lint passes of one run.
+        self._discovered: tuple[list[MigrationInfo], MigrationGraph] | None = None
+        self._discover_lock = threading.Lock()
         self._rules: list[BaseRule] = self._build_rules()
 
+    @functools.cached_property
+    def root_dir(self) -> Path:
+        # Resolved on first use: cwd lookup and symlink resolution are syscalls.
+        return (self._root_dir_raw or Path.cwd()).resolve()
+
     def _resolve_adapter(self) -> BaseMigrationAdapter:
         if self._adapter is not None:
             return self._adapter
+        with self._adapter_lock:
+            if self._adapter is None:
+                self._adapter = self._detect_adapter()
+        return self._adapter
+
+    def _detect_adapter(self) -> BaseMigrationAdapter:
+        cache_dir = self.root_dir / self.settings.cache_dir if self.settings.cache_dir else None
+        workers = self._workers() if self.settings.parallel else 1
         if self.settings.framework == "django":
-            self._adapter = DjangoAdapter(self.root_dir)
+            return DjangoAdapter(self.root_dir, cache_dir, workers)
         elif self.settings.framework == "alembic":
-            self._adapter = AlembicAdapter(self.root_dir)
+            return AlembicAdapter(self.root_dir, cache_dir, workers)
         else:
-            django = DjangoAdapter(self.root_dir)
-            alembic = AlembicAdapter(self.root_dir)
+            django = DjangoAdapter(self.root_dir, cache_dir, workers)
+            alembic = AlembicAdapter(self.root_dir, cache_dir, workers)
             if django.detect_framework():
-                self._adapter = django
+                return django
             elif alembic.detect_framework():
-                self._adapter = alembic
+                return alembic
             else:
-                self._adapter = django
-        return self._adapter
+                return django
 
     def _build_rules(self) -> list[BaseRule]:
         rules: list[BaseRule] = []
@@ -145,38 +175,72 @@ class MigrationIQEngine:
                 graph.add_edge(m.migration_id, dep)
         return graph
 
+    def _discover(self) -> tuple[list[MigrationInfo], MigrationGraph]:
+        with self._discover_lock:
+            if self._discovered is None:
+                migrations = self._resolve_adapter().discover_migrations()
+                self._discovered = (migrations, self._build_graph(migrations))
+            return self._discovered
+
     def run_check(self) -> CheckResult:
-        adapter = self._resolve_adapter()
-        migrations = adapter.discover_migrations()
-        graph = self._build_graph(migrations)
+        self._discovered = None
+        return self._check()
+
+    def _check(self) -> CheckResult:
+        migrations, graph = self._discover()
         issues = graph.analyze()
         return CheckResult(migrations=migrations, graph_issues=issues, heads=graph.find_heads(), roots=graph.find_roots())
 
     def run_lint(self) -> LintResult:
-        adapter = self._resolve_adapter()
-        migrations = adapter.discover_migrations()
-        graph = self._build_graph(migrations)
-        violations: list[RuleViolation] = []
+        self._discovered = None
+        return self._lint()
+
+    def _lint(self) -> LintResult:
+        migrations, graph = self._discover()
+        violations = self._evaluate_rules(migrations)
         for rule in self._rules:
-            for m in migrations:
-                violations.extend(rule.evaluate(m))
             if isinstance(rule, MultipleHeadsRule):
                 violations.extend(rule.evaluate_graph(graph))
         return LintResult(violations=violations)
 
+    def _workers(self) -> int:
+        return self.settings.numprocesses or os.cpu_count() or 1
+
+    def _evaluate_rules(self, migrations: list[MigrationInfo]) -> list[RuleViolation]:
+        if not self.settings.parallel or len(migrations) < 2:
+            return scan_all(migrations, self._rules)
+        workers = self._workers()
+        rule_ids = tuple(rule.rule_id for rule in self._rules)
+        size = -(-len(migrations) // (workers * _CHUNKS_PER_WORKER))
+        chunks = [migrations[i:i + size] for i in range(0, len(migrations), size)]
+        per_rule: list[list[RuleViolation]] = [[] for _ in rule_ids]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as executor:
+            for chunk_result in executor.map(_lint_chunk, chunks, itertools.repeat(rule_ids)):
+                for bucket, found in zip(per_rule, chunk_result):
+                    bucket.extend(found)
+        return [v for bucket in per_rule for v in bucket]
+
     def run_compare(self, target_branch: str | None = None) -> ComparisonReport:
         target = target_branch or self.settings.target_branch
-        comparator = BranchComparator(repo_dir=self.root_dir)
+        comparator = BranchComparator(git_client=create_git_client(self.root_dir, self.settings.git_backend))
         return comparator.compare(target)
 
     def run_ready(self) -> ReadyResult:
-        compare: ComparisonReport | None = None
-        try:
-            compare = self.run_compare()
-        except Exception:
-            pass
-        check = self.run_check()
-        lint = self.run_lint()
+        # compare waits on git while check and lint scan files, so overlap
+        # them; check and lint share a single discovery pass.
+        self._discovered = None
+        self._resolve_adapter()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            compare_future = executor.submit(self.run_compare)
+            check_future = executor.submit(self._check)
+            lint_future = executor.submit(self._lint)
+            check = check_future.result()
+            lint = lint_future.result()
+            compare: ComparisonReport | None = None
+            try:
+                compare = compare_future.result()
+            except Exception:
+                pass
         scorer = RiskScorer()
         for v in lint.violations:
             category_map = {
@@ -196,3 +260,7 @@ class MigrationIQEngine:
         ready = self.run_ready()
         thr = threshold if threshold is not None else self.settings.risk_threshold
         return ProtectResult(check=ready.check, lint=ready.lint, compare=ready.compare, risk=ready.risk, threshold=thr)
+
+
+def _lint_chunk(migrations: Sequence[MigrationInfo], rule_ids: tuple[str, ...]) -> list[list[RuleViolation]]:
+    return scan_by_rule(migrations, [_RULE_TYPES[rule_id]() for rule_id in rule_ids])
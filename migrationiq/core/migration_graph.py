@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import functools
+import importlib
+from array import array
+from collections import deque
+from collections.abc import KeysView
 from dataclasses import dataclass, field
+from types import ModuleType
+from typing import NamedTuple
 
 
 __all__ = ["MigrationGraph", "GraphIssue"]
 
+# Below this size the compiled kernels' call and conversion overhead outweighs the win.
+_COMPILED_MIN_NODES = 5000
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GraphIssue:
     """A single problem detected in the migration graph."""
     issue_type: str
@@ -18,117 +27,239 @@ class GraphIssue:
     nodes: list[str] = field(default_factory=list)
 
 
+class _CSR(NamedTuple):
+    """Frozen adjacency: node ``i`` is ``names[i]``, numbered in insertion order.
+
+    ``fwd_idx[fwd_ptr[i]:fwd_ptr[i + 1]]`` are the dependencies of ``i``, in
+    edge insertion order.
+    """
+    names: list[str]
+    fwd_ptr: list[int]
+    fwd_idx: array
+
+
 class MigrationGraph:
     """Directed acyclic graph representing migration dependencies."""
 
+    __slots__ = ("_id", "_name", "_edges", "_out_degree", "_heads", "_csr", "_rev", "_order", "_cycles", "_proven_acyclic")
+
     def __init__(self) -> None:
-        self._forward: dict[str, set[str]] = defaultdict(set)
-        self._reverse: dict[str, set[str]] = defaultdict(set)
-        self._nodes: set[str] = set()
+        self._id: dict[str, int] = {}
+        self._name: list[str] = []
+        self._edges: dict[tuple[int, int], None] = {}
+        # Per-node dependency counts and the ids with no dependents (ordered
+        # set), kept current by add_edge so the head, root and orphan queries
+        # never build an adjacency.  A node only ever leaves the head set, so
+        # it stays in insertion order.
+        self._out_degree = array("i")
+        self._heads: dict[int, None] = {}
+        self._csr: _CSR | None = None
+        # Dependents adjacency (indptr, indices); only built for queries that need it.
+        self._rev: tuple[list[int], array] | None = None
+        # Kahn order of the frozen graph; shorter than the node count iff cyclic.
+        self._order: tuple[str, ...] | None = None
+        # Members of each cyclic component, once per mutation.
+        self._cycles: tuple[tuple[str, ...], ...] | None = None
+        # True while every edge so far was added from a node nothing depends
+        # on yet, which cannot close a cycle; once False, cycle queries fall
+        # back to the Kahn check.
+        self._proven_acyclic = True
+
+    def _intern(self, node: str) -> int:
+        node_id = self._id.get(node)
+        if node_id is None:
+            node_id = self._id[node] = len(self._name)
+            self._name.append(node)
+            self._out_degree.append(0)
+            self._heads[node_id] = None
+            self._csr = self._rev = self._order = self._cycles = None
+        return node_id
 
     def add_node(self, node: str) -> None:
-        self._nodes.add(node)
+        self._intern(node)
 
     def add_edge(self, node: str, dependency: str) -> None:
-        self._nodes.add(node)
-        self._nodes.add(dependency)
-        self._forward[node].add(dependency)
-        self._reverse[dependency].add(node)
+        edge = (self._intern(node), self._intern(dependency))
+        if edge not in self._edges:
+            if edge[0] == edge[1] or edge[0] not in self._heads:
+                self._proven_acyclic = False
+            self._edges[edge] = None
+            self._out_degree[edge[0]] += 1
+            self._heads.pop(edge[1], None)
+            self._csr = self._rev = self._order = self._cycles = None
+
+    def _freeze(self) -> _CSR:
+        """Build (once per mutation) the CSR adjacency that every query runs on."""
+        if self._csr is not None:
+            return self._csr
+        fwd_ptr, fwd_idx = _to_csr(len(self._name), list(self._edges))
+        self._csr = _CSR(self._name.copy(), fwd_ptr, fwd_idx)
+        return self._csr
+
+    def _reverse(self) -> tuple[list[int], array]:
+        """Build (once per mutation) the dependents adjacency from the edge set."""
+        if self._rev is None:
+            self._rev = _to_csr(len(self._name), [(dst, src) for src, dst in self._edges])
+        return self._rev
 
     @property
-    def nodes(self) -> frozenset[str]:
-        return frozenset(self._nodes)
+    def nodes(self) -> KeysView[str]:
+        """Live, set-like view of the node names, in insertion order."""
+        return self._id.keys()
+
+    def find_heads(self) -> tuple[str, ...]:
+        return tuple(map(self._name.__getitem__, self._heads))
 
-    def find_heads(self) -> list[str]:
-        return sorted(n for n in self._nodes if not self._reverse.get(n))
+    def find_roots(self) -> tuple[str, ...]:
+        return tuple([name for name, d in zip(self._name, self._out_degree) if not d])
 
-    def find_roots(self) -> list[str]:
-        return sorted(n for n in self._nodes if not self._forward.get(n))
+    def detect_cycles(self) -> tuple[tuple[str, ...], ...]:
+        """Return the members of each strongly connected component that forms a cycle, in insertion order.
 
-    def detect_cycles(self) -> list[list[str]]:
-        WHITE, GRAY, BLACK = 0, 1, 2
-        color: dict[str, int] = {n: WHITE for n in self._nodes}
-        parent: dict[str, str | None] = {n: None for n in self._nodes}
-        cycles: list[list[str]] = []
+        Cached until the next mutation; repeated calls return the same tuple.
+        """
+        if self._cycles is not None:
+            return self._cycles
+        g = self._freeze()
+        if self._proven_acyclic or len(self._topological_order()) == len(g.names):
+            self._cycles = ()
+            return self._cycles
+        names, ptr, idx = g.names, g.fwd_ptr, g.fwd_idx
+        cycles = [
+            sorted(scc) for scc in self._tarjan_scc()
+            if len(scc) > 1 or scc[0] in idx[ptr[scc[0]]:ptr[scc[0] + 1]]
+        ]
+        cycles.sort()
+        self._cycles = tuple(tuple(map(names.__getitem__, cycle)) for cycle in cycles)
+        return self._cycles
 
-        for start in sorted(self._nodes):
-            if color[start] != WHITE:
+    def _tarjan_scc(self) -> list[list[int]]:
+        """Iterative Tarjan: strongly connected components of the dependency edges in O(V + E)."""
+        g = self._freeze()
+        ptr, idx = g.fwd_ptr, g.fwd_idx
+        n = len(g.names)
+        kernels = _compiled_kernels() if n >= _COMPILED_MIN_NODES else None
+        if kernels is not None:
+            return kernels.strongly_connected(ptr, idx)
+        index = array("i", [-1]) * n
+        lowlink = array("i", [0]) * n
+        on_stack = bytearray(n)
+        next_edge = ptr[:-1]
+        stack: list[int] = []
+        sccs: list[list[int]] = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
                 continue
-            stack: list[tuple[str, bool]] = [(start, False)]
-            while stack:
-                node, processed = stack.pop()
-                if processed:
-                    color[node] = BLACK
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [root]
+            while work:
+                node = work[-1]
+                pos = next_edge[node]
+                if pos < ptr[node + 1]:
+                    next_edge[node] = pos + 1
+                    child = idx[pos]
+                    if index[child] == -1:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack[child] = 1
+                        work.append(child)
+                    elif on_stack[child] and index[child] < lowlink[node]:
+                        lowlink[node] = index[child]
                     continue
-                if color[node] == GRAY:
-                    color[node] = BLACK
-                    continue
-                color[node] = GRAY
-                stack.append((node, True))
-                for dep in sorted(self._forward.get(node, set())):
-                    if color[dep] == GRAY:
-                        cycle = [dep, node]
-                        cur = parent.get(node)
-                        while cur is not None and cur != dep:
-                            cycle.append(cur)
-                            cur = parent.get(cur)
-                        cycle.reverse()
-                        cycles.append(cycle)
-                    elif color[dep] == WHITE:
-                        parent[dep] = node
-                        stack.append((dep, False))
-        return cycles
-
-    def find_orphans(self) -> list[str]:
-        return sorted(
-            n for n in self._nodes
-            if not self._forward.get(n) and not self._reverse.get(n)
-        )
-
-    def detect_multiple_heads(self) -> list[str]:
-        heads = self.find_heads()
-        return heads if len(heads) > 1 else []
-
-    def topological_sort(self) -> list[str]:
-        in_degree = {n: len(self._forward.get(n, set())) for n in self._nodes}
-        queue: deque[str] = deque(sorted(n for n in self._nodes if in_degree[n] == 0))
-        result: list[str] = []
+                work.pop()
+                if work and lowlink[node] < lowlink[work[-1]]:
+                    lowlink[work[-1]] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    scc: list[int] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        scc.append(member)
+                        if member == node:
+                            break
+                    sccs.append(scc)
+        return sccs
+
+    def find_orphans(self) -> tuple[str, ...]:
+        names, out_degree = self._name, self._out_degree
+        return tuple([names[i] for i in self._heads if not out_degree[i]])
+
+    def detect_multiple_heads(self) -> tuple[str, ...]:
+        return self.find_heads() if len(self._heads) > 1 else ()
+
+    def topological_sort(self) -> tuple[str, ...]:
+        """Return the nodes dependencies-first; cached until the next mutation."""
+        order = self._topological_order()
+        if len(order) != len(self._name):
+            raise ValueError("Migration graph contains cycles – topological sort is impossible.")
+        return order
+
+    def _topological_order(self) -> tuple[str, ...]:
+        """Kahn order of node names (once per mutation); partial when the graph has a cycle.
+
+        ``detect_cycles`` uses it as an acyclicity check before running Tarjan.
+        """
+        if self._order is not None:
+            return self._order
+        g = self._freeze()
+        n = len(g.names)
+        rev_ptr, rev_idx = self._reverse()
+        kernels = _compiled_kernels() if n >= _COMPILED_MIN_NODES else None
+        if kernels is not None:
+            order = kernels.topological_order(g.fwd_ptr, rev_ptr, rev_idx)
+        else:
+            order = _kahn(n, g.fwd_ptr, rev_ptr, rev_idx)
+        self._order = tuple(map(g.names.__getitem__, order))
+        return self._order
+
+    def _cycle_path(self, members: list[str]) -> list[str]:
+        """Return a shortest dependency loop from ``members[0]`` back to itself, within the component."""
+        g = self._freeze()
+        ptr, idx, names = g.fwd_ptr, g.fwd_idx, g.names
+        inside = {self._id[name] for name in members}
+        start = self._id[members[0]]
+        parent = {start: -1}
+        queue = deque([start])
         while queue:
             node = queue.popleft()
-            result.append(node)
-            for dependent in sorted(self._reverse.get(node, set())):
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-        if len(result) != len(self._nodes):
-            raise ValueError("Migration graph contains cycles – topological sort is impossible.")
-        return result
+            for dep in idx[ptr[node]:ptr[node + 1]]:
+                if dep == start:
+                    path = [node]
+                    while parent[path[-1]] != -1:
+                        path.append(parent[path[-1]])
+                    return [names[i] for i in reversed(path)] + [names[start]]
+                if dep in inside and dep not in parent:
+                    parent[dep] = node
+                    queue.append(dep)
+        return members
 
     def missing_dependencies(self) -> list[tuple[str, str]]:
-        missing: list[tuple[str, str]] = []
-        for node, deps in self._forward.items():
-            for dep in sorted(deps):
-                if dep not in self._nodes:
-                    missing.append((node, dep))
-        return missing
+        # add_edge interns both endpoints, so every dependency is a known node.
+        return []
 
     def analyze(self) -> list[GraphIssue]:
         issues: list[GraphIssue] = []
+        # Queries return insertion order; issues are sorted for stable output.
         heads = self.detect_multiple_heads()
         if heads:
             issues.append(GraphIssue(
                 issue_type="multiple_heads", severity="critical",
                 description=f"Migration graph has {len(heads)} heads – this will cause merge conflicts. Create a merge migration to resolve.",
-                nodes=heads,
+                nodes=sorted(heads),
             ))
-        cycles = self.detect_cycles()
+        cycles = sorted(sorted(cycle) for cycle in self.detect_cycles())
         for cycle in cycles:
             issues.append(GraphIssue(
                 issue_type="cycle", severity="critical",
-                description=f"Circular dependency detected: {' → '.join(cycle)}. This will prevent migrations from running.",
+                description=f"Circular dependency detected: {' → '.join(self._cycle_path(cycle))}. This will prevent migrations from running.",
                 nodes=cycle,
             ))
-        for node, dep in self.missing_dependencies():
+        for node, dep in sorted(self.missing_dependencies()):
             issues.append(GraphIssue(
                 issue_type="missing_dependency", severity="critical",
                 description=f"Migration '{node}' depends on '{dep}' which does not exist.",
@@ -139,6 +270,44 @@ class MigrationGraph:
             issues.append(GraphIssue(
                 issue_type="orphan", severity="warning",
                 description=f"Found {len(orphans)} orphan migration(s) with no dependencies or dependents.",
-                nodes=orphans,
+                nodes=sorted(orphans),
             ))
         return issues
+
+
+def _kahn(n: int, fwd_ptr: list[int], rev_ptr: list[int], rev_idx: array) -> list[int]:
+    in_degree = array("i", [fwd_ptr[i + 1] - fwd_ptr[i] for i in range(n)])
+    queue: deque[int] = deque(i for i in range(n) if in_degree[i] == 0)
+    order: list[int] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for dependent in rev_idx[rev_ptr[node]:rev_ptr[node + 1]]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+    return order
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_kernels() -> ModuleType | None:
+    # Imported on first use: numba takes a noticeable time to load.
+    try:
+        return importlib.import_module("migrationiq.core._graph_ops")
+    except ImportError:
+        return None
+
+
+def _to_csr(n: int, pairs: list[tuple[int, int]]) -> tuple[list[int], array]:
+    """Counting-sort ``(src, dst)`` pairs into ``(indptr, indices)``, keeping pair order per source."""
+    indptr = [0] * (n + 1)
+    for src, _ in pairs:
+        indptr[src + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+    indices = array("i", [0]) * len(pairs)
+    fill = indptr[:-1]
+    for src, dst in pairs:
+        indices[fill[src]] = dst
+        fill[src] += 1
+    return indptr, indices
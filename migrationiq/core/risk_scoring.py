@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from types import MappingProxyType
 
 __all__ = ["Severity", "RiskFinding", "RiskReport", "RiskScorer"]
 
@@ -16,23 +19,21 @@ class Severity(str, Enum):
 
     @classmethod
     def from_score(cls, score: int) -> Severity:
-        if score <= 3:
-            return cls.LOW
-        if score <= 6:
-            return cls.MEDIUM
-        if score <= 9:
-            return cls.HIGH
-        return cls.CRITICAL
+        return _SEVERITY_LEVELS[bisect_left(_SEVERITY_UPPER_BOUNDS, score)]
 
 
-DEFAULT_WEIGHTS: dict[str, int] = {
+# Inclusive upper score of each level but the last: <=3 LOW, <=6 MEDIUM, <=9 HIGH.
+_SEVERITY_UPPER_BOUNDS = (3, 6, 9)
+_SEVERITY_LEVELS = (Severity.LOW, Severity.MEDIUM, Severity.HIGH, Severity.CRITICAL)
+
+DEFAULT_WEIGHTS: Mapping[str, int] = MappingProxyType({
     "drop_table": 10, "drop_column": 8,
     "non_null_without_default": 7, "risky_type_change": 6,
     "multiple_heads": 9, "branch_behind_target": 5, "large_table_alter": 6,
-}
+})
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RiskFinding:
     category: str
     score: int
@@ -40,29 +41,45 @@ class RiskFinding:
     file_path: str = ""
 
 
-@dataclass
 class RiskReport:
-    findings: list[RiskFinding] = field(default_factory=list)
+    # findings is a read-only view: _total is a running sum kept by _append,
+    # so findings are added through add() / RiskScorer only.
+    __slots__ = ("_findings", "_total")
+
+    def __init__(self, findings: Iterable[RiskFinding] = ()) -> None:
+        self._findings = list(findings)
+        self._total = sum(f.score for f in self._findings)
+
+    def __repr__(self) -> str:
+        return f"RiskReport(findings={self._findings!r})"
+
+    @property
+    def findings(self) -> tuple[RiskFinding, ...]:
+        return tuple(self._findings)
 
     @property
     def total_score(self) -> int:
-        return sum(f.score for f in self.findings)
+        return self._total
 
     @property
     def severity(self) -> Severity:
         return Severity.from_score(self.total_score)
 
-    def add(self, category: str, description: str, file_path: str = "", *, weights: dict[str, int] | None = None) -> None:
-        w = weights or DEFAULT_WEIGHTS
-        score = w.get(category, 5)
-        self.findings.append(RiskFinding(category=category, score=score, description=description, file_path=file_path))
+    def add(self, category: str, description: str, file_path: str = "") -> None:
+        self._append(RiskFinding(category, DEFAULT_WEIGHTS.get(category, 5), description, file_path))
+
+    def _append(self, finding: RiskFinding) -> None:
+        self._findings.append(finding)
+        self._total += finding.score
 
     @property
     def passed(self) -> bool:
-        return len(self.findings) == 0
+        return not self._findings
 
 
 class RiskScorer:
+    __slots__ = ("weights", "_report")
+
     def __init__(self, weights: dict[str, int] | None = None) -> None:
         self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
         self._report = RiskReport()
@@ -72,10 +89,11 @@ class RiskScorer:
         return self._report
 
     def add_finding(self, category: str, description: str, file_path: str = "") -> None:
-        self._report.add(category, description, file_path, weights=self.weights)
+        # self.weights is merged once in __init__; the score is resolved here.
+        self._report._append(RiskFinding(category, self.weights.get(category, 5), description, file_path))
 
     def exceeds_threshold(self, threshold: int) -> bool:
-        return self._report.total_score > threshold
+        return self._report._total > threshold
 
     def reset(self) -> None:
         self._report = RiskReport()
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import subprocess
+import threading
+from collections.abc import Iterator
 from pathlib import Path
 
-__all__ = ["GitClient", "GitError"]
+__all__ = ["GitClient", "GitError", "create_git_client"]
 
 logger = logging.getLogger(__name__)
 
+_QUERY_CACHE_SIZE = 256
+# Seconds any single git command may run.
+_GIT_TIMEOUT = 30
+
 
 class GitError(Exception):
     def __init__(self, command: str, stderr: str, returncode: int) -> None:
@@ -21,17 +28,27 @@ class GitError(Exception):
 
 class GitClient:
     def __init__(self, repo_dir: Path | None = None) -> None:
-        self.repo_dir = (repo_dir or Path.cwd()).resolve()
+        self._repo_dir_raw = repo_dir
+        # Read-only queries are memoised per client; fetch() drops them.
+        self._run_cached = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(self._run)
+
+    @functools.cached_property
+    def repo_dir(self) -> Path:
+        return (self._repo_dir_raw or Path.cwd()).resolve()
+
+    def invalidate(self) -> None:
+        """Forget cached query results, e.g. after refs have moved."""
+        self._run_cached.cache_clear()
 
     def _run(self, *args: str, check: bool = True) -> str:
         cmd = ["git", *args]
         logger.debug("Running: %s (cwd=%s)", " ".join(cmd), self.repo_dir)
         try:
-            result = subprocess.run(cmd, cwd=self.repo_dir, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(cmd, cwd=self.repo_dir, capture_output=True, text=True, timeout=_GIT_TIMEOUT)
         except FileNotFoundError:
             raise GitError(args[0] if args else "git", "Git is not installed or not in PATH", 127)
         except subprocess.TimeoutExpired:
-            raise GitError(args[0] if args else "git", "Command timed out after 30s", 124)
+            raise GitError(args[0] if args else "git", f"Command timed out after {_GIT_TIMEOUT}s", 124)
         if check and result.returncode != 0:
             raise GitError(args[0] if args else "git", result.stderr, result.returncode)
         return result.stdout.strip()
@@ -45,31 +62,94 @@ class GitClient:
 
     def fetch(self, remote: str = "origin") -> None:
         self._run("fetch", remote)
+        self.invalidate()
 
     def current_branch(self) -> str:
-        return self._run("rev-parse", "--abbrev-ref", "HEAD")
+        return self._run_cached("rev-parse", "--abbrev-ref", "HEAD")
 
     def rev_parse(self, ref: str) -> str:
-        return self._run("rev-parse", ref)
+        return self._run_cached("rev-parse", ref)
 
     def merge_base(self, ref_a: str, ref_b: str) -> str:
+        # merge-base is symmetric, so (a, b) and (b, a) share one cache entry.
+        if ref_b < ref_a:
+            ref_a, ref_b = ref_b, ref_a
         try:
-            return self._run("merge-base", ref_a, ref_b)
+            return self._run_cached("merge-base", ref_a, ref_b)
         except GitError:
             return ""
 
     def diff_files(self, ref_a: str, ref_b: str) -> list[str]:
-        output = self._run("diff", "--name-only", ref_a, ref_b, check=False)
+        output = self._run_cached("diff", "--name-only", ref_a, ref_b, check=False)
         if not output:
             return []
         return [line.strip() for line in output.splitlines() if line.strip()]
 
+    def iter_diff_files(self, ref_a: str, ref_b: str) -> Iterator[str]:
+        """Yield changed paths as ``git diff --name-only`` prints them, without buffering its output.
+
+        Unlike :meth:`diff_files` this is not cached.  It ignores failures the
+        same way (a bad ref simply yields nothing) but, like every other
+        query, raises :class:`GitError` when git runs past the timeout.
+        """
+        cmd = ["git", "diff", "--name-only", ref_a, ref_b]
+        logger.debug("Streaming: %s (cwd=%s)", " ".join(cmd), self.repo_dir)
+        try:
+            proc = subprocess.Popen(
+                cmd, cwd=self.repo_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1,
+            )
+        except FileNotFoundError:
+            raise GitError("diff", "Git is not installed or not in PATH", 127)
+        # Reading blocks while git is stuck, so the deadline kills it instead.
+        timer = threading.Timer(_GIT_TIMEOUT, proc.kill)
+        timer.start()
+        with proc:
+            try:
+                for line in proc.stdout:
+                    path = line.strip()
+                    if path:
+                        yield path
+            finally:
+                timed_out = timer.finished.is_set()
+                timer.cancel()
+                # Stops git when the caller abandons the iterator early.
+                proc.kill()
+        if timed_out:
+            raise GitError("diff", f"Command timed out after {_GIT_TIMEOUT}s", 124)
+
     def commits_between(self, base_ref: str, head_ref: str) -> int:
-        output = self._run("rev-list", "--count", f"{base_ref}..{head_ref}", check=False)
+        output = self._run_cached("rev-list", "--count", f"{base_ref}..{head_ref}", check=False)
         try:
             return int(output)
         except ValueError:
             return 0
 
+    def rev_list_leftright(self, ref_a: str, ref_b: str) -> tuple[int, int]:
+        """Return ``(ahead, behind)``: commits only in *ref_a* and only in *ref_b*, in one exec."""
+        output = self._run_cached("rev-list", "--left-right", "--count", f"{ref_a}...{ref_b}", check=False)
+        try:
+            ahead, behind = output.split()
+            return int(ahead), int(behind)
+        except ValueError:
+            return 0, 0
+
     def diff_stat(self, ref_a: str, ref_b: str) -> str:
-        return self._run("diff", "--stat", ref_a, ref_b, check=False)
+        return self._run_cached("diff", "--stat", ref_a, ref_b, check=False)
+
+
+def create_git_client(repo_dir: Path | None = None, backend: str = "auto") -> GitClient:
+    """Return a client for *backend*: ``"subprocess"``, ``"libgit2"`` or ``"auto"``.
+
+    ``"auto"`` and ``"libgit2"`` use the in-process libgit2 client when pygit2
+    is installed and *repo_dir* is a repository, and fall back to the
+    subprocess client otherwise.
+    """
+    if backend != "subprocess":
+        try:
+            from migrationiq.git.libgit2_client import Libgit2Client
+
+            return Libgit2Client(repo_dir)
+        except (ImportError, GitError) as exc:
+            if backend == "libgit2":
+                logger.warning("libgit2 backend unavailable (%s); using the git executable", exc)
+    return GitClient(repo_dir)
@@ -0,0 +1,83 @@
+"""In-process Git queries through libgit2 (``pip install "migrationiq[libgit2]"``)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pygit2
+
+from migrationiq.git.git_utils import GitClient, GitError
+
+__all__ = ["Libgit2Client"]
+
+_LOOKUP_ERRORS = (pygit2.GitError, KeyError, ValueError)
+
+
+class Libgit2Client(GitClient):
+    """:class:`GitClient` whose read-only queries run in-process via pygit2.
+
+    ``fetch`` and ``diff_stat`` still shell out to ``git``.  merge-base and
+    ahead/behind walks use the commit-graph file when the repository has one
+    (``git commit-graph write --reachable``).
+    """
+
+    def __init__(self, repo_dir: Path | None = None) -> None:
+        super().__init__(repo_dir)
+        git_dir = pygit2.discover_repository(str(self.repo_dir))
+        if git_dir is None:
+            raise GitError("rev-parse", f"not a git repository: {self.repo_dir}", 128)
+        self._repo = pygit2.Repository(git_dir)
+
+    def _commit(self, ref: str) -> pygit2.Commit:
+        return self._repo.revparse_single(ref).peel(pygit2.Commit)
+
+    def is_git_repo(self) -> bool:
+        return True
+
+    def current_branch(self) -> str:
+        repo = self._repo
+        try:
+            return "HEAD" if repo.head_is_detached else repo.head.shorthand
+        except _LOOKUP_ERRORS as exc:
+            raise GitError("rev-parse", str(exc), 128)
+
+    def rev_parse(self, ref: str) -> str:
+        try:
+            return str(self._repo.revparse_single(ref).id)
+        except _LOOKUP_ERRORS as exc:
+            raise GitError("rev-parse", str(exc), 128)
+
+    def merge_base(self, ref_a: str, ref_b: str) -> str:
+        try:
+            oid = self._repo.merge_base(self._commit(ref_a).id, self._commit(ref_b).id)
+        except _LOOKUP_ERRORS:
+            return ""
+        return str(oid) if oid is not None else ""
+
+    def iter_diff_files(self, ref_a: str, ref_b: str) -> Iterator[str]:
+        try:
+            diff = self._repo.diff(self._commit(ref_a), self._commit(ref_b))
+        except _LOOKUP_ERRORS:
+            return
+        # Report renames under their new path, as ``git diff --name-only`` does.
+        diff.find_similar()
+        for delta in diff.deltas:
+            yield delta.new_file.path
+
+    def diff_files(self, ref_a: str, ref_b: str) -> list[str]:
+        return list(self.iter_diff_files(ref_a, ref_b))
+
+    def commits_between(self, base_ref: str, head_ref: str) -> int:
+        try:
+            walker = self._repo.walk(self._commit(head_ref).id)
+            walker.hide(self._commit(base_ref).id)
+        except _LOOKUP_ERRORS:
+            return 0
+        return sum(1 for _ in walker)
+
+    def rev_list_leftright(self, ref_a: str, ref_b: str) -> tuple[int, int]:
+        try:
+            return self._repo.ahead_behind(self._commit(ref_a).id, self._commit(ref_b).id)
+        except _LOOKUP_ERRORS:
+            return 0, 0
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import functools
+import string
+from array import array
+from abc import ABC
+from bisect import bisect_left
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import Protocol
 
-if TYPE_CHECKING:
-    from migrationiq.adapters.base import MigrationInfo
+__all__ = ["MigrationLike", "ViolationSeverity", "RuleViolation", "BaseRule"]
 
-__all__ = ["ViolationSeverity", "RuleViolation", "BaseRule"]
+
+class MigrationLike(Protocol):
+    """The parts of a migration that per-migration rules read.
+
+    :class:`~migrationiq.adapters.base.MigrationInfo` satisfies it; rules
+    never import the adapters.
+    """
+
+    @property
+    def sql_content(self) -> str: ...
+
+    @property
+    def file_path(self) -> Path | None: ...
 
 
 class ViolationSeverity(str, Enum):
@@ -20,7 +37,7 @@ class ViolationSeverity(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleViolation:
     rule_id: str
     severity: ViolationSeverity
@@ -33,9 +50,56 @@ class RuleViolation:
 
 
 class BaseRule(ABC):
+    # Rules are stateless; subclasses declare empty __slots__ too.
+    __slots__ = ()
     rule_id: str = "base"
     description: str = ""
+    # Case-insensitive patterns, at least one of which must occur in a
+    # migration for ``evaluate`` to report anything.  ``None`` means the rule
+    # always runs; an empty tuple means it never fires per migration.
+    triggers: tuple[str, ...] | None = None
 
-    @abstractmethod
-    def evaluate(self, migration: MigrationInfo) -> list[RuleViolation]:
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        # Each default below calls the other, so a concrete rule must override one.
+        super().__init_subclass__(**kwargs)
+        if cls.evaluate is BaseRule.evaluate and cls.iter_violations is BaseRule.iter_violations:
+            raise TypeError(f"{cls.__name__} must override evaluate() or iter_violations()")
+
+    def evaluate(self, migration: MigrationLike) -> list[RuleViolation]:
         """Analyse a migration and return any violations found."""
+        return list(self.iter_violations(migration))
+
+    def iter_violations(self, migration: MigrationLike) -> Iterator[RuleViolation]:
+        """Yield the violations of *migration*; built-in rules override this to scan lazily."""
+        yield from self.evaluate(migration)
+
+
+@functools.lru_cache(maxsize=8)
+def _newline_offsets(content: str) -> array:
+    # Cached so every rule run over the same migration shares one scan; a
+    # packed array keeps the cached index at 8 bytes per line.
+    offsets = array("q")
+    pos = content.find("\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find("\n", pos + 1)
+    return offsets
+
+
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+@functools.lru_cache(maxsize=8)
+def _upper(content: str) -> str:
+    """Return *content* with ASCII letters uppercased and every offset unchanged.
+
+    Rules scan this with case-sensitive uppercase patterns instead of
+    ``re.IGNORECASE``.  ``str.upper`` alone could lengthen non-ASCII text
+    (``"ß"`` -> ``"SS"``) and shift offsets away from the original.
+    """
+    return content.upper() if content.isascii() else content.translate(_ASCII_UPPER)
+
+
+def _line_of(content: str, pos: int) -> int:
+    """Return the 1-based line number of offset *pos* in *content*."""
+    return bisect_left(_newline_offsets(content), pos) + 1
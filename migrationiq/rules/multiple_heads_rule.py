@@ -1,19 +1,20 @@
 """Rule: Detect multiple heads in the migration graph."""
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from migrationiq.rules.base_rule import BaseRule, RuleViolation, ViolationSeverity
+from migrationiq.rules.base_rule import BaseRule, MigrationLike, RuleViolation, ViolationSeverity
 if TYPE_CHECKING:
-    from migrationiq.adapters.base import MigrationInfo
     from migrationiq.core.migration_graph import MigrationGraph
 
 __all__ = ["MultipleHeadsRule"]
 
 
 class MultipleHeadsRule(BaseRule):
+    __slots__ = ()
     rule_id = "multiple-heads"
     description = "Detects multiple leaf nodes in the migration graph, which indicates conflicting migration branches."
+    triggers = ()
 
-    def evaluate(self, migration: MigrationInfo) -> list[RuleViolation]:
+    def evaluate(self, migration: MigrationLike) -> list[RuleViolation]:
         return []
 
     def evaluate_graph(self, graph: MigrationGraph) -> list[RuleViolation]:
@@ -1,55 +1,86 @@
 """Rule: Detect adding a NOT NULL column without a default value."""
 from __future__ import annotations
 import re
-from typing import TYPE_CHECKING
-from migrationiq.rules.base_rule import BaseRule, RuleViolation, ViolationSeverity
-if TYPE_CHECKING:
-    from migrationiq.adapters.base import MigrationInfo
+from collections.abc import Iterator
+from typing import ClassVar
+from migrationiq.rules.base_rule import BaseRule, MigrationLike, RuleViolation, ViolationSeverity, _line_of, _upper
 
 __all__ = ["NonNullRule"]
 
-_ADD_COL_NOT_NULL_SQL_RE = re.compile(r"\bADD\s+COLUMN\s+\w+\s+\w+[^;]*\bNOT\s+NULL\b(?![^;]*\bDEFAULT\b)", re.IGNORECASE | re.DOTALL)
-_DJANGO_ADD_FIELD_RE = re.compile(r"\bAddField\b", re.IGNORECASE)
-_DJANGO_NULL_FALSE_RE = re.compile(r"\bnull\s*=\s*False\b", re.IGNORECASE)
-_DJANGO_DEFAULT_RE = re.compile(r"\bdefault\s*=", re.IGNORECASE)
-_ALEMBIC_ADD_COL_RE = re.compile(r"\bop\.add_column\b", re.IGNORECASE)
-_ALEMBIC_NULLABLE_FALSE_RE = re.compile(r"\bnullable\s*=\s*False\b", re.IGNORECASE)
+# One alternation so the content is scanned once; lastgroup names the flavour.
+# Identifier tokens keep Unicode \w, as before the patterns became re.ASCII.
+_NON_NULL_RE = re.compile(
+    r"(?P<sql>\bADD\s+COLUMN\s+(?u:\w+)\s+(?u:\w+))"
+    r"|(?P<django>\bADDFIELD\b)"
+    r"|(?P<alembic>\bOP\.ADD_COLUMN\b)",
+    re.ASCII,
+)
+# Searched only within the ADD COLUMN statement, up to its ``;``.
+_SQL_NOT_NULL_RE = re.compile(r"\bNOT\s+NULL\b", re.ASCII)
+_SQL_DEFAULT_RE = re.compile(r"\bDEFAULT\b", re.ASCII)
+_DJANGO_NULL_FALSE_RE = re.compile(r"\bNULL\s*=\s*FALSE\b", re.ASCII)
+_DJANGO_DEFAULT_RE = re.compile(r"\bDEFAULT\s*=", re.ASCII)
+_ALEMBIC_NULLABLE_FALSE_RE = re.compile(r"\bNULLABLE\s*=\s*FALSE\b", re.ASCII)
+
+_NON_NULL_EXPLANATION = "Adding a NOT NULL column without a default value will fail on tables that already contain rows."
+_NON_NULL_FIX = "Use a two-step migration approach:\n1. Add the column as nullable with a default value.\n2. Back-fill existing rows.\n3. In a separate migration, set NOT NULL."
+_NON_NULL_EXAMPLE = "# Step 1:\nALTER TABLE users ADD COLUMN role VARCHAR(50) DEFAULT 'member';\n# Step 2:\nUPDATE users SET role = 'member' WHERE role IS NULL;\n# Step 3:\nALTER TABLE users ALTER COLUMN role SET NOT NULL;"
 
 
 class NonNullRule(BaseRule):
+    __slots__ = ()
     rule_id = "non-null-without-default"
     description = "Detects ADD COLUMN NOT NULL without DEFAULT – risky for populated tables."
+    triggers = (r"ADD\s+COLUMN", "AddField", "add_column")
+    # Uppercase substrings, one of which every match contains; a plain
+    # ``in`` test on them lets clean migrations skip the regex entirely.
+    _KEYWORDS: ClassVar[tuple[str, ...]] = ("COLUMN", "ADDFIELD")
+    messages: ClassVar[dict[str, str]] = {
+        "sql": "SQL ADD COLUMN NOT NULL without DEFAULT detected",
+        "django": "Django AddField with null=False and no default value",
+        "alembic": "Alembic op.add_column() with nullable=False",
+    }
 
-    def evaluate(self, migration: MigrationInfo) -> list[RuleViolation]:
-        violations: list[RuleViolation] = []
+    def iter_violations(self, migration: MigrationLike) -> Iterator[RuleViolation]:
         content = migration.sql_content
-        for match in _ADD_COL_NOT_NULL_SQL_RE.finditer(content):
-            line_no = content[:match.start()].count("\n") + 1
-            violations.append(self._make_violation(migration, line_no, "SQL ADD COLUMN NOT NULL without DEFAULT detected"))
-        self._check_django_add_field(content, migration, violations)
-        self._check_alembic_add_column(content, migration, violations)
-        return violations
-
-    def _check_django_add_field(self, content: str, migration: MigrationInfo, violations: list[RuleViolation]) -> None:
-        for match in _DJANGO_ADD_FIELD_RE.finditer(content):
+        text = _upper(content)
+        if not any(key in text for key in self._KEYWORDS):
+            return
+        messages, make = self.messages, self._make_violation
+        file_path = str(migration.file_path or "")
+        for match in _NON_NULL_RE.finditer(text):
+            kind = match.lastgroup
             start = match.start()
-            context = content[start:min(start + 300, len(content))]
-            if _DJANGO_NULL_FALSE_RE.search(context) and not _DJANGO_DEFAULT_RE.search(context):
-                violations.append(self._make_violation(migration, content[:start].count("\n") + 1, "Django AddField with null=False and no default value"))
+            if kind == "sql" and not self._check_sql_add_column(text, match.end()):
+                continue
+            if kind == "django" and not self._check_django_add_field(text, start):
+                continue
+            if kind == "alembic" and not self._check_alembic_add_column(text, start):
+                continue
+            yield make(file_path, _line_of(content, start), messages[kind])
 
-    def _check_alembic_add_column(self, content: str, migration: MigrationInfo, violations: list[RuleViolation]) -> None:
-        for match in _ALEMBIC_ADD_COL_RE.finditer(content):
-            start = match.start()
-            context = content[start:min(start + 300, len(content))]
-            if _ALEMBIC_NULLABLE_FALSE_RE.search(context):
-                violations.append(self._make_violation(migration, content[:start].count("\n") + 1, "Alembic op.add_column() with nullable=False"))
+    @staticmethod
+    def _check_sql_add_column(content: str, pos: int) -> bool:
+        end = content.find(";", pos)
+        if end == -1:
+            end = len(content)
+        return bool(_SQL_NOT_NULL_RE.search(content, pos, end)) and not _SQL_DEFAULT_RE.search(content, pos, end)
+
+    @staticmethod
+    def _check_django_add_field(content: str, start: int) -> bool:
+        end = min(start + 300, len(content))
+        return bool(_DJANGO_NULL_FALSE_RE.search(content, start, end)) and not _DJANGO_DEFAULT_RE.search(content, start, end)
+
+    @staticmethod
+    def _check_alembic_add_column(content: str, start: int) -> bool:
+        return bool(_ALEMBIC_NULLABLE_FALSE_RE.search(content, start, min(start + 300, len(content))))
 
-    def _make_violation(self, migration: MigrationInfo, line_no: int, message: str) -> RuleViolation:
+    def _make_violation(self, file_path: str, line_no: int, message: str) -> RuleViolation:
         return RuleViolation(
             rule_id=self.rule_id, severity=ViolationSeverity.ERROR,
-            file_path=str(migration.file_path or ""), message=message,
-            explanation="Adding a NOT NULL column without a default value will fail on tables that already contain rows.",
-            suggested_fix="Use a two-step migration approach:\n1. Add the column as nullable with a default value.\n2. Back-fill existing rows.\n3. In a separate migration, set NOT NULL.",
-            example_snippet="# Step 1:\nALTER TABLE users ADD COLUMN role VARCHAR(50) DEFAULT 'member';\n# Step 2:\nUPDATE users SET role = 'member' WHERE role IS NULL;\n# Step 3:\nALTER TABLE users ALTER COLUMN role SET NOT NULL;",
+            file_path=file_path, message=message,
+            explanation=_NON_NULL_EXPLANATION,
+            suggested_fix=_NON_NULL_FIX,
+            example_snippet=_NON_NULL_EXAMPLE,
             line_hint=line_no,
         )
@@ -0,0 +1,120 @@
+"""Single-pass prefilter that decides which lint rules can fire on a migration."""
+
+from __future__ import annotations
+
+import functools
+import re
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import replace
+
+try:
+    import hyperscan
+except ImportError:  # optional: pip install "migrationiq[fast]"
+    hyperscan = None
+
+from migrationiq.rules.base_rule import BaseRule, MigrationLike, RuleViolation
+
+__all__ = ["scan_all", "scan_by_rule"]
+
+
+def scan_all(migrations: Sequence[MigrationLike], rules: Sequence[BaseRule]) -> list[RuleViolation]:
+    """Evaluate *rules* over *migrations*, skipping rules whose triggers are absent.
+
+    The migrations are scanned for the triggers of all rules together in a
+    single batch; only the rules that matched then run.  Violations
+    come out rule by rule, in migration order within each rule.
+    """
+    return [v for found in scan_by_rule(migrations, rules) for v in found]
+
+
+def scan_by_rule(migrations: Sequence[MigrationLike], rules: Sequence[BaseRule]) -> list[list[RuleViolation]]:
+    """Like :func:`scan_all` but with one violation list per rule."""
+    prefilter = _build_prefilter(tuple(rule.triggers for rule in rules))
+    # Bucket migrations by triggered rule so each rule's loop only visits
+    # migrations it can fire on, with its rule method bound once.
+    buckets: list[list[MigrationLike]] = [[] for _ in rules]
+    for m, hits in zip(migrations, prefilter([m.sql_content for m in migrations])):
+        for i in hits:
+            buckets[i].append(m)
+    per_rule: list[list[RuleViolation]] = []
+    for rule, bucket in zip(rules, buckets):
+        # The lazy iter_violations, unless a subclass overrides evaluate.
+        violations_of = rule.evaluate if type(rule).evaluate is not BaseRule.evaluate else rule.iter_violations
+        # Identical migrations (vendored copies) are evaluated once per call;
+        # later copies reuse the result stamped with their own file path.
+        seen: dict[str, list[RuleViolation]] = {}
+        found: list[RuleViolation] = []
+        for m in bucket:
+            cached = seen.get(m.sql_content)
+            if cached is None:
+                cached = seen[m.sql_content] = list(violations_of(m))
+                found.extend(cached)
+            elif cached:
+                file_path = str(m.file_path or "")
+                found.extend(replace(v, file_path=file_path) for v in cached)
+        per_rule.append(found)
+    return per_rule
+
+
+@functools.lru_cache(maxsize=8)
+def _build_prefilter(triggers: tuple[tuple[str, ...] | None, ...]):
+    always = frozenset(i for i, t in enumerate(triggers) if t is None)
+    keyed = [(i, t) for i, t in enumerate(triggers) if t]
+    if not keyed:
+        return lambda contents: [always] * len(contents)
+    if hyperscan is not None:
+        return _hyperscan_prefilter(always, keyed)
+    return _re_prefilter(always, keyed)
+
+
+def _re_prefilter(always: frozenset[int], keyed: list[tuple[int, tuple[str, ...]]]):
+    fused = re.compile(
+        "|".join(f"(?P<r{i}>{'|'.join(t)})" for i, t in keyed),
+        re.IGNORECASE,
+    )
+    rule_of = {f"r{i}": i for i, _ in keyed}
+    wanted = len(always) + len(keyed)
+
+    def prefilter(contents: Sequence[str]) -> list[set[int]]:
+        # One scan over all contents joined by NUL, which no trigger can
+        # match across.  Each hit is mapped back to its migration by offset,
+        # and the scan jumps to the next migration once every rule has fired.
+        hits = [set(always) for _ in contents]
+        ends: list[int] = []
+        end = -1
+        for content in contents:
+            end += len(content) + 1
+            ends.append(end)
+        joined = "\0".join(contents)
+        search = fused.search
+        match = search(joined)
+        while match is not None:
+            j = bisect_right(ends, match.start())
+            found = hits[j]
+            found.add(rule_of[match.lastgroup])
+            match = search(joined, ends[j] + 1 if len(found) == wanted else match.end())
+        return hits
+
+    return prefilter
+
+
+def _hyperscan_prefilter(always: frozenset[int], keyed: list[tuple[int, tuple[str, ...]]]):
+    expressions = [p.encode() for _, t in keyed for p in t]
+    ids = [i for i, t in keyed for _ in t]
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=expressions, ids=ids, elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+    )
+
+    def on_match(rule_index: int, start: int, end: int, flags: int, hits: set[int]) -> None:
+        hits.add(rule_index)
+
+    def prefilter(contents: Sequence[str]) -> list[set[int]]:
+        hits = [set(always) for _ in contents]
+        for content, found in zip(contents, hits):
+            db.scan(content.encode("utf-8", "surrogatepass"), match_event_handler=on_match, context=found)
+        return hits
+
+    return prefilter
@@ -1,44 +1,60 @@
 """Rule: Detect risky column type changes in migrations."""
 from __future__ import annotations
 import re
-from typing import TYPE_CHECKING
-from migrationiq.rules.base_rule import BaseRule, RuleViolation, ViolationSeverity
-if TYPE_CHECKING:
-    from migrationiq.adapters.base import MigrationInfo
+from collections.abc import Iterator
+from typing import ClassVar
+from migrationiq.rules.base_rule import BaseRule, MigrationLike, RuleViolation, ViolationSeverity, _line_of, _upper
 
 __all__ = ["TypeChangeRule"]
 
-_ALTER_TYPE_SQL_RE = re.compile(r"\bALTER\s+COLUMN\s+\w+\s+(SET\s+DATA\s+)?TYPE\b", re.IGNORECASE)
-_DJANGO_ALTER_FIELD_RE = re.compile(r"\bAlterField\b", re.IGNORECASE)
-_ALEMBIC_ALTER_COL_RE = re.compile(r"\bop\.alter_column\b", re.IGNORECASE)
-_ALEMBIC_TYPE_PARAM_RE = re.compile(r"\btype_\s*=", re.IGNORECASE)
+# One alternation so the content is scanned once; lastgroup names the flavour.
+# Identifier tokens keep Unicode \w, as before the patterns became re.ASCII.
+_TYPE_CHANGE_RE = re.compile(
+    r"(?P<sql>\bALTER\s+COLUMN\s+(?u:\w+)\s+(?:SET\s+DATA\s+)?TYPE\b)"
+    r"|(?P<django>\bALTERFIELD\b)"
+    r"|(?P<alembic>\bOP\.ALTER_COLUMN\b)",
+    re.ASCII,
+)
+_ALEMBIC_TYPE_PARAM_RE = re.compile(r"\bTYPE_\s*=", re.ASCII)
+
+_TYPE_CHANGE_EXPLANATION = "Changing a column's type can silently truncate or corrupt data. On large tables the ALTER may acquire an exclusive lock and cause downtime."
+_TYPE_CHANGE_FIX = "1. Add a new column with the desired type.\n2. Back-fill data with a safe cast.\n3. Update application code to use the new column.\n4. Drop the old column in a subsequent release."
+_TYPE_CHANGE_EXAMPLE = "# Instead of:\n#   ALTER TABLE orders ALTER COLUMN amount TYPE INTEGER;\n# Use:\nALTER TABLE orders ADD COLUMN amount_new INTEGER;\nUPDATE orders SET amount_new = amount::INTEGER;\nALTER TABLE orders DROP COLUMN amount;\nALTER TABLE orders RENAME COLUMN amount_new TO amount;"
 
 
 class TypeChangeRule(BaseRule):
+    __slots__ = ()
     rule_id = "type-change"
     description = "Detects column type changes that can lose data or lock tables."
+    triggers = (r"ALTER\s+COLUMN", "AlterField", "alter_column")
+    _KEYWORDS: ClassVar[tuple[str, ...]] = ("COLUMN", "ALTERFIELD")
+    messages: ClassVar[dict[str, str]] = {
+        "sql": "ALTER COLUMN TYPE statement found",
+        "django": "Django AlterField operation found – may involve type change",
+        "alembic": "Alembic op.alter_column() with type_ parameter",
+    }
 
-    def evaluate(self, migration: MigrationInfo) -> list[RuleViolation]:
-        violations: list[RuleViolation] = []
+    def iter_violations(self, migration: MigrationLike) -> Iterator[RuleViolation]:
         content = migration.sql_content
-        for match in _ALTER_TYPE_SQL_RE.finditer(content):
-            violations.append(self._make_violation(migration, content[:match.start()].count("\n") + 1, "ALTER COLUMN TYPE statement found"))
-        for match in _DJANGO_ALTER_FIELD_RE.finditer(content):
-            violations.append(self._make_violation(migration, content[:match.start()].count("\n") + 1, "Django AlterField operation found – may involve type change"))
-        for match in _ALEMBIC_ALTER_COL_RE.finditer(content):
+        text = _upper(content)
+        if not any(key in text for key in self._KEYWORDS):
+            return
+        messages, make = self.messages, self._make_violation
+        file_path = str(migration.file_path or "")
+        for match in _TYPE_CHANGE_RE.finditer(text):
+            kind = match.lastgroup
             start = match.start()
-            context = content[start:min(start + 300, len(content))]
-            if _ALEMBIC_TYPE_PARAM_RE.search(context):
-                violations.append(self._make_violation(migration, content[:start].count("\n") + 1, "Alembic op.alter_column() with type_ parameter"))
-        return violations
+            if kind == "alembic" and not _ALEMBIC_TYPE_PARAM_RE.search(text, start, min(start + 300, len(text))):
+                continue
+            yield make(file_path, _line_of(content, start), messages[kind])
 
     @staticmethod
-    def _make_violation(migration: MigrationInfo, line_no: int, message: str) -> RuleViolation:
+    def _make_violation(file_path: str, line_no: int, message: str) -> RuleViolation:
         return RuleViolation(
             rule_id="type-change", severity=ViolationSeverity.WARNING,
-            file_path=str(migration.file_path or ""), message=message,
-            explanation="Changing a column's type can silently truncate or corrupt data. On large tables the ALTER may acquire an exclusive lock and cause downtime.",
-            suggested_fix="1. Add a new column with the desired type.\n2. Back-fill data with a safe cast.\n3. Update application code to use the new column.\n4. Drop the old column in a subsequent release.",
-            example_snippet="# Instead of:\n#   ALTER TABLE orders ALTER COLUMN amount TYPE INTEGER;\n# Use:\nALTER TABLE orders ADD COLUMN amount_new INTEGER;\nUPDATE orders SET amount_new = amount::INTEGER;\nALTER TABLE orders DROP COLUMN amount;\nALTER TABLE orders RENAME COLUMN amount_new TO amount;",
+            file_path=file_path, message=message,
+            explanation=_TYPE_CHANGE_EXPLANATION,
+            suggested_fix=_TYPE_CHANGE_FIX,
+            example_snippet=_TYPE_CHANGE_EXAMPLE,
             line_hint=line_no,
         )
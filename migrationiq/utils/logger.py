@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.theme import Theme
+import functools
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+# ``console`` is still importable by name; it is resolved lazily by the
+# module __getattr__ below and kept out of __all__ so ``import *`` stays lazy.
 __all__ = [
-    "console",
     "print_success",
     "print_warning",
     "print_error",
@@ -18,38 +22,58 @@ __all__ = [
     "create_panel",
 ]
 
-_THEME = Theme(
-    {
-        "success": "bold green",
-        "warning": "bold yellow",
-        "error": "bold red",
-        "info": "bold cyan",
-        "muted": "dim",
-        "accent": "bold magenta",
-    }
-)
+_THEME_STYLES: dict[str, str] = {
+    "success": "bold green",
+    "warning": "bold yellow",
+    "error": "bold red",
+    "info": "bold cyan",
+    "muted": "dim",
+    "accent": "bold magenta",
+}
+
+
+@functools.cache
+def _get_console() -> Console:
+    # Built on first use so importing this module does not pull in Rich or
+    # probe the terminal.
+    from rich.console import Console
+    from rich.theme import Theme
+
+    return Console(theme=Theme(_THEME_STYLES))
+
 
-console = Console(theme=_THEME)
+@functools.cache
+def _prefix(style: str, symbol: str) -> Text:
+    # Pre-styled so Rich does not re-parse the same markup on every line.
+    from rich.text import Text
+
+    return Text(symbol, style=style)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def print_success(message: str) -> None:
     """Print a success message with a checkmark."""
-    console.print(f"[success]✔[/success] {message}")
+    _get_console().print(_prefix("success", "✔"), message)
 
 
 def print_warning(message: str) -> None:
     """Print a warning message with a caution sign."""
-    console.print(f"[warning]⚠[/warning] {message}")
+    _get_console().print(_prefix("warning", "⚠"), message)
 
 
 def print_error(message: str) -> None:
     """Print an error message with a cross."""
-    console.print(f"[error]✖[/error] {message}")
+    _get_console().print(_prefix("error", "✖"), message)
 
 
 def print_info(message: str) -> None:
     """Print an informational message."""
-    console.print(f"[info]ℹ[/info] {message}")
+    _get_console().print(_prefix("info", "ℹ"), message)
 
 
 def create_table(
@@ -58,11 +82,14 @@ def create_table(
     rows: list[list[str]],
 ) -> Table:
     """Create a Rich table with the given columns and rows."""
+    from rich.table import Table
+
     table = Table(title=title, show_lines=True, expand=True)
     for header, style in columns:
         table.add_column(header, style=style)
+    add_row = table.add_row
     for row in rows:
-        table.add_row(*row)
+        add_row(*row)
     return table
 
 
@@ -73,6 +100,9 @@ def create_panel(
     subtitle: str | None = None,
 ) -> Panel:
     """Create a Rich panel for structured output."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     return Panel(
         Text(content),
         title=title,
@@ -2,145 +2,145 @@
 
 from __future__ import annotations
 
-import textwrap
 from pathlib import Path
 
 import pytest
 
 from migrationiq.adapters.base import MigrationInfo
 from migrationiq.config.settings import MigrationIQSettings
+from migrationiq.core.migration_graph import MigrationGraph
+
+DJANGO_MIGRATION_0001 = """\
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    initial = True
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.AutoField(primary_key=True)),
+                ('username', models.CharField(max_length=150)),
+            ],
+        ),
+    ]
+"""
+
+DJANGO_MIGRATION_0002 = """\
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='User',
+            name='email',
+            field=models.EmailField(null=False),
+        ),
+    ]
+"""
+
+DJANGO_MIGRATION_DROP = """\
+from django.db import migrations
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0002_add_email'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(name='User'),
+        migrations.RemoveField(model_name='Profile', name='bio'),
+    ]
+"""
+
+DJANGO_MIGRATION_ALTER = """\
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0002_add_email'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='User',
+            name='email',
+            field=models.TextField(),
+        ),
+    ]
+"""
+
+ALEMBIC_REVISION_001 = """\
+\"\"\"create users table\"\"\"
+revision = 'abc123'
+down_revision = None
+
+from alembic import op
+import sqlalchemy as sa
+
+def upgrade():
+    op.create_table('users',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('name', sa.String(50)),
+    )
 
-DJANGO_MIGRATION_0001 = textwrap.dedent("""\
-    from django.db import migrations, models
-
-    class Migration(migrations.Migration):
-
-        initial = True
-        dependencies = []
-
-        operations = [
-            migrations.CreateModel(
-                name='User',
-                fields=[
-                    ('id', models.AutoField(primary_key=True)),
-                    ('username', models.CharField(max_length=150)),
-                ],
-            ),
-        ]
-""")
-
-DJANGO_MIGRATION_0002 = textwrap.dedent("""\
-    from django.db import migrations, models
-
-    class Migration(migrations.Migration):
-
-        dependencies = [
-            ('myapp', '0001_initial'),
-        ]
-
-        operations = [
-            migrations.AddField(
-                model_name='User',
-                name='email',
-                field=models.EmailField(null=False),
-            ),
-        ]
-""")
-
-DJANGO_MIGRATION_DROP = textwrap.dedent("""\
-    from django.db import migrations
-
-    class Migration(migrations.Migration):
-
-        dependencies = [
-            ('myapp', '0002_add_email'),
-        ]
-
-        operations = [
-            migrations.DeleteModel(name='User'),
-            migrations.RemoveField(model_name='Profile', name='bio'),
-        ]
-""")
-
-DJANGO_MIGRATION_ALTER = textwrap.dedent("""\
-    from django.db import migrations, models
-
-    class Migration(migrations.Migration):
-
-        dependencies = [
-            ('myapp', '0002_add_email'),
-        ]
-
-        operations = [
-            migrations.AlterField(
-                model_name='User',
-                name='email',
-                field=models.TextField(),
-            ),
-        ]
-""")
-
-ALEMBIC_REVISION_001 = textwrap.dedent("""\
-    \"\"\"create users table\"\"\"
-    revision = 'abc123'
-    down_revision = None
-
-    from alembic import op
-    import sqlalchemy as sa
-
-    def upgrade():
-        op.create_table('users',
-            sa.Column('id', sa.Integer, primary_key=True),
-            sa.Column('name', sa.String(50)),
-        )
+def downgrade():
+    op.drop_table('users')
+"""
 
-    def downgrade():
-        op.drop_table('users')
-""")
+ALEMBIC_REVISION_002 = """\
+\"\"\"add email column\"\"\"
+revision = 'def456'
+down_revision = 'abc123'
 
-ALEMBIC_REVISION_002 = textwrap.dedent("""\
-    \"\"\"add email column\"\"\"
-    revision = 'def456'
-    down_revision = 'abc123'
+from alembic import op
+import sqlalchemy as sa
 
-    from alembic import op
-    import sqlalchemy as sa
+def upgrade():
+    op.add_column('users', sa.Column('email', sa.String(255), nullable=False))
 
-    def upgrade():
-        op.add_column('users', sa.Column('email', sa.String(255), nullable=False))
+def downgrade():
+    op.drop_column('users', 'email')
+"""
 
-    def downgrade():
-        op.drop_column('users', 'email')
-""")
+ALEMBIC_REVISION_DROP = """\
+\"\"\"drop users table\"\"\"
+revision = 'ghi789'
+down_revision = 'def456'
 
-ALEMBIC_REVISION_DROP = textwrap.dedent("""\
-    \"\"\"drop users table\"\"\"
-    revision = 'ghi789'
-    down_revision = 'def456'
+from alembic import op
 
-    from alembic import op
-
-    def upgrade():
-        op.drop_table('users')
+def upgrade():
+    op.drop_table('users')
 
-    def downgrade():
-        pass
-""")
+def downgrade():
+    pass
+"""
 
-ALEMBIC_REVISION_ALTER = textwrap.dedent("""\
-    \"\"\"change column type\"\"\"
-    revision = 'jkl012'
-    down_revision = 'def456'
+ALEMBIC_REVISION_ALTER = """\
+\"\"\"change column type\"\"\"
+revision = 'jkl012'
+down_revision = 'def456'
 
-    from alembic import op
-    import sqlalchemy as sa
+from alembic import op
+import sqlalchemy as sa
 
-    def upgrade():
-        op.alter_column('users', 'name', type_=sa.Text())
+def upgrade():
+    op.alter_column('users', 'name', type_=sa.Text())
 
-    def downgrade():
-        op.alter_column('users', 'name', type_=sa.String(50))
-""")
+def downgrade():
+    op.alter_column('users', 'name', type_=sa.String(50))
+"""
 
 
 @pytest.fixture
@@ -174,7 +174,7 @@ def default_settings() -> MigrationIQSettings:
 def sample_migration_info() -> MigrationInfo:
     return MigrationInfo(
         migration_id="myapp.0001_initial", app_label="myapp",
-        dependencies=[], operations=["CREATE TABLE: User"],
+        dependencies=(), operations=("CREATE TABLE: User",),
         sql_content=DJANGO_MIGRATION_0001,
     )
 
@@ -183,8 +183,8 @@ def sample_migration_info() -> MigrationInfo:
 def drop_migration_info() -> MigrationInfo:
     return MigrationInfo(
         migration_id="myapp.0003_drop", app_label="myapp",
-        dependencies=["myapp.0002_add_email"],
-        operations=["DROP TABLE: User", "DROP COLUMN: bio"],
+        dependencies=("myapp.0002_add_email",),
+        operations=("DROP TABLE: User", "DROP COLUMN: bio"),
         sql_content=DJANGO_MIGRATION_DROP,
     )
 
@@ -193,7 +193,35 @@ def drop_migration_info() -> MigrationInfo:
 def alter_migration_info() -> MigrationInfo:
     return MigrationInfo(
         migration_id="myapp.0003_alter", app_label="myapp",
-        dependencies=["myapp.0002_add_email"],
-        operations=["ALTER TABLE ALTER COLUMN: email"],
+        dependencies=("myapp.0002_add_email",),
+        operations=("ALTER TABLE ALTER COLUMN: email",),
         sql_content=DJANGO_MIGRATION_ALTER,
     )
+
+
+def _graph(*edges: tuple[str, str]) -> MigrationGraph:
+    g = MigrationGraph()
+    for node, dep in edges:
+        g.add_edge(node, dep)
+    return g
+
+
+# Session-scoped graphs are shared between tests: only query them.
+@pytest.fixture(scope="session")
+def chain_graph() -> MigrationGraph:
+    return _graph(("b", "a"), ("c", "b"))
+
+
+@pytest.fixture(scope="session")
+def forked_graph() -> MigrationGraph:
+    return _graph(("b", "a"), ("c", "a"))
+
+
+@pytest.fixture(scope="session")
+def diamond_graph() -> MigrationGraph:
+    return _graph(("b", "a"), ("c", "a"), ("d", "b"), ("d", "c"))
+
+
+@pytest.fixture(scope="session")
+def cycle_graph() -> MigrationGraph:
+    return _graph(("a", "b"), ("b", "a"))
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from pathlib import Path
 import pytest
+from migrationiq.adapters._parse_cache import ParseCache
 from migrationiq.adapters.django_adapter import DjangoAdapter
 from migrationiq.adapters.alembic_adapter import AlembicAdapter
 from tests.conftest import (
@@ -55,6 +56,51 @@ class TestDjangoAdapterParsing:
         migrations = DjangoAdapter(tmp_path).discover_migrations()
         assert any("DROP TABLE" in op for op in migrations[0].operations)
 
+    def test_virtualenv_migrations_ignored(self, tmp_django_project) -> None:
+        vendored = tmp_django_project / ".venv" / "lib" / "django" / "contrib" / "auth" / "migrations"
+        vendored.mkdir(parents=True)
+        (vendored / "__init__.py").write_text("")
+        (vendored / "0001_initial.py").write_text(DJANGO_MIGRATION_0001)
+        assert len(DjangoAdapter(tmp_django_project).discover_migrations()) == 2
+
+    def test_app_named_build_discovered(self, tmp_path) -> None:
+        mig = tmp_path / "build" / "migrations"
+        mig.mkdir(parents=True)
+        (mig / "__init__.py").write_text("")
+        (mig / "0001_initial.py").write_text(DJANGO_MIGRATION_0001)
+        assert [m.migration_id for m in DjangoAdapter(tmp_path).discover_migrations()] == ["build.0001_initial"]
+
+    def test_helper_module_without_migration_class_skipped(self, tmp_path) -> None:
+        mig = tmp_path / "myapp" / "migrations"
+        mig.mkdir(parents=True)
+        (mig / "__init__.py").write_text("")
+        (mig / "0001_initial.py").write_text(DJANGO_MIGRATION_0001)
+        (mig / "helpers.py").write_text("def forwards(apps, schema_editor):\n    pass\n")
+        assert [m.migration_id for m in DjangoAdapter(tmp_path).discover_migrations()] == ["myapp.0001_initial"]
+
+    def test_large_project_parsed_in_pool(self, tmp_path) -> None:
+        mig = tmp_path / "myapp" / "migrations"
+        mig.mkdir(parents=True)
+        (mig / "__init__.py").write_text("")
+        for i in range(40):
+            (mig / f"{i:04d}_step.py").write_text(DJANGO_MIGRATION_0002)
+        migrations = DjangoAdapter(tmp_path, workers=2).discover_migrations()
+        assert [m.migration_id for m in migrations] == [f"myapp.{i:04d}_step" for i in range(40)]
+
+    def test_large_project_serial_unless_parallel(self, tmp_path, monkeypatch) -> None:
+        from migrationiq.adapters import base
+        mig = tmp_path / "myapp" / "migrations"
+        mig.mkdir(parents=True)
+        (mig / "__init__.py").write_text("")
+        for i in range(40):
+            (mig / f"{i:04d}_step.py").write_text(DJANGO_MIGRATION_0002)
+        monkeypatch.setattr(base, "ProcessPoolExecutor", None)
+        assert len(DjangoAdapter(tmp_path).discover_migrations()) == 40
+        cache_dir = tmp_path / ".migrationiq_cache"
+        DjangoAdapter(tmp_path, cache_dir).discover_migrations()
+        (mig / "0040_step.py").write_text(DJANGO_MIGRATION_0002)
+        assert len(DjangoAdapter(tmp_path, cache_dir, workers=4).discover_migrations()) == 41
+
 
 class TestAlembicAdapterDetection:
     def test_detects_alembic_ini(self, tmp_path) -> None:
@@ -78,7 +124,34 @@ class TestAlembicAdapterParsing:
     def test_initial_has_no_deps(self, tmp_alembic_project) -> None:
         migrations = AlembicAdapter(tmp_alembic_project).discover_migrations()
         m1 = next(m for m in migrations if m.migration_id == "abc123")
-        assert m1.dependencies == []
+        assert m1.dependencies == ()
+
+    def test_merge_revision_has_both_parents(self) -> None:
+        source = b"revision = 'm1'\ndown_revision = ('abc123', 'def456')\n"
+        assert AlembicAdapter._extract_down_revision(source) == ["abc123", "def456"]
+
+    def test_commented_out_op_not_reported(self) -> None:
+        source = b"def upgrade():\n    # op.drop_table('legacy')\n    op.create_index(op.f('ix_email'), 'users', ['email'])\n"
+        assert AlembicAdapter._extract_operations(source, Path("x.py")) == ["CREATE INDEX", "f: ix_email"]
+
+    def test_module_level_op_after_upgrade_not_reported(self) -> None:
+        source = b"def upgrade():\n    op.drop_table('a')\n\nop.drop_table('b')\n"
+        assert AlembicAdapter._extract_operations(source, Path("x.py")) == ["DROP TABLE: a"]
+
+    @pytest.mark.parametrize("continuation", [b"{'id': 1},\n", b"ROWS,\n"])
+    def test_dedented_continuation_keeps_later_ops(self, continuation) -> None:
+        source = b"def upgrade():\n    op.bulk_insert(t, [\n" + continuation + b"])\n    op.drop_table('users')\n"
+        assert AlembicAdapter._extract_operations(source, Path("x.py")) == ["bulk_insert", "DROP TABLE: users"]
+
+    def test_ast_fallback_keeps_source_order(self) -> None:
+        body = (
+            b"    with op.batch_alter_table('t') as batch:\n"
+            b"        op.drop_column('t', 'x')\n"
+            b"    op.execute('SELECT 1')\n"
+        )
+        scanned = AlembicAdapter._extract_operations(b"def upgrade():\n" + body, Path("x.py"))
+        parsed = AlembicAdapter._extract_operations(b'def upgrade():\n    """Doc."""\n' + body, Path("x.py"))
+        assert scanned == parsed == ["batch_alter_table: t", "ALTER TABLE DROP COLUMN: t", "RAW SQL: SELECT 1"]
 
     def test_drop_table_revision(self, tmp_path) -> None:
         versions = tmp_path / "alembic" / "versions"
@@ -89,6 +162,13 @@ class TestAlembicAdapterParsing:
         migrations = AlembicAdapter(tmp_path).discover_migrations()
         assert any("DROP TABLE" in op for op in migrations[0].operations)
 
+    def test_versions_dir_found_next_to_nested_env_py(self, tmp_path) -> None:
+        versions = tmp_path / "backend" / "db" / "versions"
+        versions.mkdir(parents=True)
+        (tmp_path / "backend" / "db" / "env.py").write_text("")
+        (versions / "001_create_users.py").write_text(ALEMBIC_REVISION_001)
+        assert [m.migration_id for m in AlembicAdapter(tmp_path).discover_migrations()] == ["abc123"]
+
     def test_non_revision_file_skipped(self, tmp_path) -> None:
         versions = tmp_path / "alembic" / "versions"
         versions.mkdir(parents=True)
@@ -96,3 +176,23 @@ class TestAlembicAdapterParsing:
         (tmp_path / "alembic" / "env.py").write_text("")
         (versions / "helper.py").write_text("x = 1\n")
         assert len(AlembicAdapter(tmp_path).discover_migrations()) == 0
+
+
+class TestParseCache:
+    def test_second_run_served_from_cache(self, tmp_django_project) -> None:
+        cache_dir = tmp_django_project / ".migrationiq_cache"
+        first = DjangoAdapter(tmp_django_project, cache_dir).discover_migrations()
+        assert len(list(cache_dir.glob("*.json"))) == 2
+        assert DjangoAdapter(tmp_django_project, cache_dir).discover_migrations() == first
+
+    def test_edited_file_is_reparsed(self, tmp_alembic_project) -> None:
+        cache_dir = tmp_alembic_project / ".migrationiq_cache"
+        AlembicAdapter(tmp_alembic_project, cache_dir).discover_migrations()
+        (tmp_alembic_project / "alembic" / "versions" / "002_add_email.py").write_text(ALEMBIC_REVISION_DROP)
+        ids = {m.migration_id for m in AlembicAdapter(tmp_alembic_project, cache_dir).discover_migrations()}
+        assert ids == {"abc123", "ghi789"}
+
+    def test_key_includes_adapter(self, tmp_path) -> None:
+        path = tmp_path / "0001_initial.py"
+        path.write_text(DJANGO_MIGRATION_0001)
+        assert ParseCache(tmp_path, "DjangoAdapter")._entry_path(path) != ParseCache(tmp_path, "AlembicAdapter")._entry_path(path)
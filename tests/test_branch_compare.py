@@ -1,9 +1,9 @@
 """Tests for branch comparison logic (Git operations are mocked)."""
 from __future__ import annotations
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import pytest
 from migrationiq.core.branch_compare import BranchComparator, ComparisonReport
-from migrationiq.git.git_utils import GitClient
+from migrationiq.git.git_utils import GitClient, create_git_client
 
 
 class TestComparisonReport:
@@ -27,12 +27,12 @@ class TestBranchComparator:
         mock.fetch.return_value = None
         mock.current_branch.return_value = branch
         mock.merge_base.return_value = merge_base
-        mock.commits_between.return_value = commits_behind
+        mock.rev_list_leftright.return_value = (0, commits_behind)
         def diff_files(a, b):
             if b == "origin/main":
                 return diff_target or []
             return diff_current or []
-        mock.diff_files.side_effect = diff_files
+        mock.iter_diff_files.side_effect = lambda a, b: iter(diff_files(a, b))
         return mock
 
     def test_clean_comparison(self) -> None:
@@ -60,6 +60,91 @@ class TestBranchComparator:
         r = BranchComparator(git_client=self._make_mock_git(merge_base="")).compare("origin/main")
         assert any("merge base" in s.lower() for s in r.suggestions)
 
+    def test_queries_use_head_and_single_rev_list(self) -> None:
+        mock = self._make_mock_git(commits_behind=2)
+        r = BranchComparator(git_client=mock).compare("origin/main")
+        assert r.current_branch == "feature/add-users" and r.commits_behind == 2
+        mock.merge_base.assert_called_once_with("HEAD", "origin/main")
+        mock.rev_list_leftright.assert_called_once_with("HEAD", "origin/main")
+        mock.commits_between.assert_not_called()
+
+    @pytest.mark.parametrize("path, expected", [
+        ("myapp/migrations/0001_initial.py", True),
+        ("myapp\\migrations\\0001_initial.py", True),
+        ("alembic/versions/abc123_add.py", True),
+        ("myapp/migrations/squashed/0001.py", True),
+        ("myapp/mymigrations/0001.py", False),
+        ("myapp/migrations/README.md", False),
+    ])
+    def test_is_migration_file(self, path, expected) -> None:
+        assert BranchComparator._is_migration_file(path) is expected
+
     def test_non_migration_files_ignored(self) -> None:
         r = BranchComparator(git_client=self._make_mock_git(diff_current=["src/models.py", "README.md"])).compare("origin/main")
         assert r.current_only == []
+
+
+class TestGitClientCache:
+    def test_merge_base_cached_across_argument_order(self, tmp_path) -> None:
+        done = MagicMock(returncode=0, stdout="abc123\n", stderr="")
+        with patch("migrationiq.git.git_utils.subprocess.run", return_value=done) as run:
+            git = GitClient(repo_dir=tmp_path)
+            assert git.merge_base("HEAD", "origin/main") == "abc123"
+            assert git.merge_base("origin/main", "HEAD") == "abc123"
+            assert run.call_count == 1
+            git.fetch()
+            git.merge_base("HEAD", "origin/main")
+            assert run.call_count == 3
+
+    def test_streamed_diff_times_out(self, tmp_path, monkeypatch) -> None:
+        import subprocess
+        import sys
+        from migrationiq.git import git_utils
+        popen = subprocess.Popen
+        hung = [sys.executable, "-c", "import time; time.sleep(30)"]
+        monkeypatch.setattr(git_utils, "_GIT_TIMEOUT", 0.2)
+        monkeypatch.setattr(git_utils.subprocess, "Popen", lambda cmd, **kwargs: popen(hung, **kwargs))
+        with pytest.raises(git_utils.GitError, match="timed out"):
+            list(GitClient(repo_dir=tmp_path).iter_diff_files("a", "b"))
+
+
+class TestLibgit2Client:
+    @pytest.fixture
+    def repo(self, tmp_path, monkeypatch):
+        import subprocess
+        for var in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+            monkeypatch.setenv(var, "t")
+        for var in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+            monkeypatch.setenv(var, "t@example.com")
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+        git("init", "-q", "-b", "main")
+        git("commit", "-q", "--allow-empty", "-m", "root")
+        git("checkout", "-q", "-b", "target")
+        (tmp_path / "app" / "migrations").mkdir(parents=True)
+        (tmp_path / "app" / "migrations" / "0002_other.py").write_text("x = 1\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "target")
+        git("checkout", "-q", "main")
+        (tmp_path / "app" / "migrations").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "app" / "migrations" / "0002_mine.py").write_text("y = 2\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "mine")
+        return tmp_path
+
+    def test_matches_subprocess_client(self, repo) -> None:
+        pytest.importorskip("pygit2")
+        from migrationiq.git.libgit2_client import Libgit2Client
+        fast, slow = Libgit2Client(repo), GitClient(repo)
+        assert fast.current_branch() == slow.current_branch() == "main"
+        base = slow.merge_base("HEAD", "target")
+        assert fast.merge_base("HEAD", "target") == base and fast.rev_parse("HEAD") == slow.rev_parse("HEAD")
+        assert fast.rev_list_leftright("HEAD", "target") == slow.rev_list_leftright("HEAD", "target") == (1, 1)
+        assert fast.commits_between(base, "target") == slow.commits_between(base, "target") == 1
+        assert fast.diff_files(base, "target") == slow.diff_files(base, "target") == ["app/migrations/0002_other.py"]
+        assert fast.merge_base("HEAD", "no-such-ref") == "" and fast.diff_files("no-such-ref", "HEAD") == []
+
+    def test_factory_falls_back_outside_a_repository(self, tmp_path) -> None:
+        client = create_git_client(tmp_path, "auto")
+        assert type(client) is GitClient
+        assert type(create_git_client(tmp_path, "subprocess")) is GitClient
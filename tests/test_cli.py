@@ -8,24 +8,9 @@ runner = CliRunner()
 
 
 class TestCLIHelp:
-    def test_main_help(self) -> None:
-        r = runner.invoke(app, ["--help"])
-        assert r.exit_code == 0
-
-    def test_check_help(self) -> None:
-        assert runner.invoke(app, ["check", "--help"]).exit_code == 0
-
-    def test_lint_help(self) -> None:
-        assert runner.invoke(app, ["lint", "--help"]).exit_code == 0
-
-    def test_compare_help(self) -> None:
-        assert runner.invoke(app, ["compare", "--help"]).exit_code == 0
-
-    def test_ready_help(self) -> None:
-        assert runner.invoke(app, ["ready", "--help"]).exit_code == 0
-
-    def test_protect_help(self) -> None:
-        assert runner.invoke(app, ["protect", "--help"]).exit_code == 0
+    @pytest.mark.parametrize("command", [[], ["check"], ["lint"], ["compare"], ["ready"], ["protect"]], ids=lambda c: c[0] if c else "main")
+    def test_help(self, command: list[str]) -> None:
+        assert runner.invoke(app, [*command, "--help"]).exit_code == 0
 
 
 class TestCheckCommand:
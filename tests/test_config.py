@@ -15,6 +15,7 @@ class TestMigrationIQSettings:
     def test_defaults(self) -> None:
         s = MigrationIQSettings()
         assert s.database == "postgres" and s.target_branch == "origin/main" and s.risk_threshold == 7
+        assert s.cache_dir is None
 
     def test_custom_values(self) -> None:
         s = MigrationIQSettings(database="mysql", risk_threshold=5)
@@ -49,3 +50,16 @@ class TestLoadSettings:
     def test_backward_compat_migrasafe_yaml(self, tmp_path) -> None:
         (tmp_path / "migrasafe.yaml").write_text("database: mysql\n")
         assert load_settings(search_dir=tmp_path).database == "mysql"
+
+    def test_cached_load_returns_independent_settings(self, tmp_path) -> None:
+        (tmp_path / "migrationiq.yaml").write_text("framework: auto\n")
+        first = load_settings(search_dir=tmp_path)
+        first.framework = "django"
+        assert load_settings(search_dir=tmp_path).framework == "auto"
+
+    def test_config_created_or_edited_later_is_reread(self, tmp_path) -> None:
+        assert load_settings(search_dir=tmp_path).database == "postgres"
+        (tmp_path / "migrationiq.yaml").write_text("database: mysql\n")
+        assert load_settings(search_dir=tmp_path).database == "mysql"
+        (tmp_path / "migrationiq.yaml").write_text("database: sqlite\n# edited\n")
+        assert load_settings(search_dir=tmp_path).database == "sqlite"
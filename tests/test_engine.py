@@ -37,6 +37,32 @@ class TestLintResult:
         r = MigrationIQEngine(settings=MigrationIQSettings(framework="django"), root_dir=django_project_with_drop).run_lint()
         assert any(v.rule_id == "drop-column" for v in r.violations)
 
+    def test_parallel_lint_matches_serial(self, django_project_with_drop) -> None:
+        serial = MigrationIQEngine(settings=MigrationIQSettings(framework="django"), root_dir=django_project_with_drop).run_lint()
+        settings = MigrationIQSettings(framework="django", parallel=True, numprocesses=2)
+        parallel = MigrationIQEngine(settings=settings, root_dir=django_project_with_drop).run_lint()
+        assert parallel.violations == serial.violations and serial.violations
+
+
+class TestDiscovery:
+    def test_ready_discovers_once(self, tmp_django_project, monkeypatch) -> None:
+        e = MigrationIQEngine(settings=MigrationIQSettings(framework="django"), root_dir=tmp_django_project)
+        adapter = e._resolve_adapter()
+        calls = []
+        original = adapter.discover_migrations
+        monkeypatch.setattr(adapter, "discover_migrations", lambda: calls.append(1) or original())
+        e.run_ready()
+        assert len(calls) == 1
+        e.run_check()
+        assert len(calls) == 2
+
+
+class TestRootDir:
+    def test_resolved_lazily(self, tmp_path) -> None:
+        e = MigrationIQEngine(settings=MigrationIQSettings(), root_dir=tmp_path / "sub" / "..")
+        assert "root_dir" not in vars(e)
+        assert e.root_dir == tmp_path.resolve()
+
 
 class TestEngineAutoDetect:
     def test_auto_detects_django(self, tmp_django_project) -> None:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import pytest
 from migrationiq.core.migration_graph import MigrationGraph
+from tests.conftest import _graph
 
 
 class TestMigrationGraphConstruction:
@@ -15,6 +16,13 @@ class TestMigrationGraphConstruction:
         g.add_edge("b", "a")
         assert "a" in g.nodes and "b" in g.nodes
 
+    def test_queries_see_edges_added_after_a_query(self) -> None:
+        g = MigrationGraph()
+        g.add_edge("b", "a")
+        assert g.find_heads() == ("b",)
+        g.add_edge("c", "b")
+        assert g.find_heads() == ("c",) and g.topological_sort() == ("a", "b", "c")
+
     def test_nodes_are_unique(self) -> None:
         g = MigrationGraph()
         g.add_node("a")
@@ -23,42 +31,34 @@ class TestMigrationGraphConstruction:
 
 
 class TestHeadsAndRoots:
-    def test_single_chain_has_one_head(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "b")
-        assert g.find_heads() == ["c"]
+    def test_single_chain_has_one_head(self, chain_graph) -> None:
+        assert chain_graph.find_heads() == ("c",)
 
-    def test_single_chain_has_one_root(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "b")
-        assert g.find_roots() == ["a"]
+    def test_single_chain_has_one_root(self, chain_graph) -> None:
+        assert chain_graph.find_roots() == ("a",)
+
+    def test_forked_graph_has_multiple_heads(self, forked_graph) -> None:
+        assert forked_graph.find_heads() == ("b", "c")
 
-    def test_forked_graph_has_multiple_heads(self) -> None:
+    def test_duplicate_edge_counted_once(self) -> None:
         g = MigrationGraph()
         g.add_edge("b", "a")
-        g.add_edge("c", "a")
-        assert sorted(g.find_heads()) == ["b", "c"]
+        g.add_edge("b", "a")
+        g.add_node("c")
+        assert g.find_heads() == ("b", "c") and g.find_roots() == ("a", "c") and g.find_orphans() == ("c",)
 
     def test_detect_multiple_heads_empty_for_single(self) -> None:
         g = MigrationGraph()
         g.add_edge("b", "a")
-        assert g.detect_multiple_heads() == []
+        assert g.detect_multiple_heads() == ()
 
 
 class TestCycleDetection:
-    def test_no_cycle_in_dag(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "b")
-        assert g.detect_cycles() == []
+    def test_no_cycle_in_dag(self, chain_graph) -> None:
+        assert chain_graph.detect_cycles() == ()
 
-    def test_simple_cycle(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("a", "b")
-        g.add_edge("b", "a")
-        assert len(g.detect_cycles()) >= 1
+    def test_simple_cycle(self, cycle_graph) -> None:
+        assert len(cycle_graph.detect_cycles()) >= 1
 
     def test_three_node_cycle(self) -> None:
         g = MigrationGraph()
@@ -67,6 +67,20 @@ class TestCycleDetection:
         g.add_edge("c", "a")
         assert len(g.detect_cycles()) >= 1
 
+    def test_cycle_closed_by_late_edge(self) -> None:
+        g = MigrationGraph()
+        g.add_edge("b", "a")
+        g.add_edge("c", "b")
+        assert g.detect_cycles() == ()
+        g.add_edge("a", "c")
+        assert g.detect_cycles() == (("b", "a", "c"),)
+
+    def test_cycles_reported_once_per_component(self) -> None:
+        g = MigrationGraph()
+        for node, dep in [("a", "b"), ("b", "c"), ("c", "a"), ("c", "b"), ("d", "d"), ("e", "a")]:
+            g.add_edge(node, dep)
+        assert g.detect_cycles() == (("a", "b", "c"), ("d",))
+
 
 class TestOrphans:
     def test_isolated_node_is_orphan(self) -> None:
@@ -78,45 +92,69 @@ class TestOrphans:
     def test_connected_node_is_not_orphan(self) -> None:
         g = MigrationGraph()
         g.add_edge("b", "a")
-        assert g.find_orphans() == []
+        assert g.find_orphans() == ()
 
 
 class TestTopologicalSort:
-    def test_linear_chain(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "b")
-        order = g.topological_sort()
+    def test_linear_chain(self, chain_graph) -> None:
+        order = chain_graph.topological_sort()
         assert order.index("a") < order.index("b") < order.index("c")
 
-    def test_diamond(self) -> None:
-        g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "a")
-        g.add_edge("d", "b")
-        g.add_edge("d", "c")
-        order = g.topological_sort()
+    def test_diamond(self, diamond_graph) -> None:
+        order = diamond_graph.topological_sort()
         assert order.index("a") < order.index("d")
 
-    def test_cycle_raises(self) -> None:
+    def test_repeated_sort_reuses_cached_tuple(self) -> None:
         g = MigrationGraph()
-        g.add_edge("a", "b")
         g.add_edge("b", "a")
+        assert g.topological_sort() is g.topological_sort()
+        g.add_edge("c", "b")
+        assert g.topological_sort() == ("a", "b", "c")
+
+    def test_cycle_raises(self, cycle_graph) -> None:
+        with pytest.raises(ValueError, match="cycle"):
+            cycle_graph.topological_sort()
+
+
+class TestCompiledKernels:
+    def test_match_pure_python(self, monkeypatch) -> None:
+        pytest.importorskip("numba")
+        import migrationiq.core.migration_graph as graph_module
+        dag_edges = [("b", "a"), ("c", "a"), ("d", "b"), ("d", "c")]
+        cyclic_edges = dag_edges + [("x", "y"), ("y", "x"), ("z", "z")]
+        expected_cycles = _graph(*cyclic_edges).detect_cycles()
+        expected_order = _graph(*dag_edges).topological_sort()
+        # Fresh graphs so no order cached by the pure-Python pass is reused.
+        monkeypatch.setattr(graph_module, "_COMPILED_MIN_NODES", 0)
+        g = _graph(*cyclic_edges)
+        assert g.detect_cycles() == expected_cycles == (("x", "y"), ("z",))
+        assert _graph(*dag_edges).topological_sort() == expected_order
         with pytest.raises(ValueError, match="cycle"):
             g.topological_sort()
 
 
 class TestAnalyze:
+    def test_issue_nodes_sorted(self) -> None:
+        g = MigrationGraph()
+        g.add_edge("z", "m")
+        g.add_edge("b", "m")
+        assert g.find_heads() == ("z", "b")
+        assert g.analyze()[0].nodes == ["b", "z"]
+
     def test_clean_graph(self) -> None:
         g = MigrationGraph()
         g.add_edge("b", "a")
         assert len(g.analyze()) == 0
 
-    def test_multiple_heads_detected(self) -> None:
+    def test_cycle_described_as_dependency_path(self) -> None:
         g = MigrationGraph()
-        g.add_edge("b", "a")
-        g.add_edge("c", "a")
-        assert any(i.issue_type == "multiple_heads" for i in g.analyze())
+        for node, dep in [("a", "c"), ("c", "b"), ("b", "a")]:
+            g.add_edge(node, dep)
+        (issue,) = g.analyze()
+        assert "a → c → b → a" in issue.description and issue.nodes == ["a", "b", "c"]
+
+    def test_multiple_heads_detected(self, forked_graph) -> None:
+        assert any(i.issue_type == "multiple_heads" for i in forked_graph.analyze())
 
     def test_orphan_detected(self) -> None:
         g = MigrationGraph()
@@ -1,7 +1,7 @@
 """Tests for the risk scoring system."""
 from __future__ import annotations
 import pytest
-from migrationiq.core.risk_scoring import DEFAULT_WEIGHTS, RiskReport, RiskScorer, Severity
+from migrationiq.core.risk_scoring import DEFAULT_WEIGHTS, RiskFinding, RiskReport, RiskScorer, Severity
 
 
 class TestSeverity:
@@ -19,6 +19,18 @@ class TestRiskReport:
         r = RiskReport()
         assert r.total_score == 0 and r.severity == Severity.LOW and r.passed
 
+    def test_initial_findings_count_toward_total(self) -> None:
+        r = RiskReport(findings=[RiskFinding("custom", 2, "pre-existing")])
+        r.add("drop_column", "Dropped a column")
+        assert r.total_score == 2 + DEFAULT_WEIGHTS["drop_column"]
+
+    def test_findings_are_read_only(self) -> None:
+        r = RiskReport()
+        r.add("drop_table", "Dropped users table")
+        with pytest.raises(AttributeError):
+            r.findings.append(RiskFinding("custom", 2, "bypass"))
+        assert len(r.findings) == 1 and r.total_score == DEFAULT_WEIGHTS["drop_table"]
+
     def test_add_finding(self) -> None:
         r = RiskReport()
         r.add("drop_table", "Dropped users table")
@@ -63,3 +75,9 @@ class TestRiskScorer:
         s = RiskScorer()
         s.add_finding("custom_issue", "Unknown")
         assert s.report.total_score == 5
+
+    def test_custom_weights_override_defaults(self) -> None:
+        s = RiskScorer(weights={"drop_table": 1})
+        s.add_finding("drop_table", "Small table")
+        s.add_finding("drop_column", "Dropped column")
+        assert s.report.total_score == 1 + DEFAULT_WEIGHTS["drop_column"]
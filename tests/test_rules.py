@@ -1,13 +1,16 @@
 """Tests for all lint rules."""
 from __future__ import annotations
+from pathlib import Path
 import pytest
 from migrationiq.adapters.base import MigrationInfo
 from migrationiq.core.migration_graph import MigrationGraph
+from migrationiq.rules.base_rule import BaseRule
 from migrationiq.rules.drop_table_rule import DropTableRule
 from migrationiq.rules.drop_column_rule import DropColumnRule
 from migrationiq.rules.non_null_rule import NonNullRule
 from migrationiq.rules.type_change_rule import TypeChangeRule
 from migrationiq.rules.multiple_heads_rule import MultipleHeadsRule
+from migrationiq.rules.scanner import scan_all
 from tests.conftest import (
     DJANGO_MIGRATION_0001, DJANGO_MIGRATION_DROP, DJANGO_MIGRATION_ALTER,
     ALEMBIC_REVISION_DROP, ALEMBIC_REVISION_002, ALEMBIC_REVISION_ALTER,
@@ -51,10 +54,24 @@ class TestDropColumnRule:
         m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users DROP COLUMN legacy;")
         assert len(DropColumnRule().evaluate(m)) >= 1
 
+    def test_line_hints_follow_match_positions(self) -> None:
+        content = "-- header\nALTER TABLE a DROP COLUMN x;\n\nALTER TABLE b DROP COLUMN y;\n"
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content=content)
+        assert [v.line_hint for v in DropColumnRule().evaluate(m)] == [2, 4]
+
     def test_violation_severity_is_error(self) -> None:
         m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users DROP COLUMN legacy;")
         assert all(v.severity.value == "ERROR" for v in DropColumnRule().evaluate(m))
 
+    def test_iter_violations_is_lazy(self) -> None:
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE a DROP COLUMN b;\nALTER TABLE a DROP COLUMN c;")
+        it = DropColumnRule().iter_violations(m)
+        assert next(it).line_hint == 1 and next(it).line_hint == 2
+
+    def test_lowercase_and_non_ascii_content(self) -> None:
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content="-- straße\nalter table users drop column legacy;")
+        assert [v.line_hint for v in DropColumnRule().evaluate(m)] == [2]
+
 
 class TestNonNullRule:
     def test_no_violation_on_safe_migration(self, sample_migration_info) -> None:
@@ -68,6 +85,24 @@ class TestNonNullRule:
         m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users ADD COLUMN age INTEGER NOT NULL DEFAULT 0;")
         assert len(NonNullRule().evaluate(m)) == 0
 
+    def test_raw_sql_default_before_not_null_passes(self) -> None:
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users ADD COLUMN age INTEGER DEFAULT 0 NOT NULL;")
+        assert len(NonNullRule().evaluate(m)) == 0
+
+    @pytest.mark.parametrize("sql, expected", [
+        ("ALTER TABLE users ADD COLUMN größe INTEGER NOT NULL;", 1),
+        ("ALTER TABLE users ADD COLUMN name VARCHAR(50) NOT NULL;", 1),
+        ('ALTER TABLE users ADD COLUMN "name" INTEGER NOT NULL;', 0),
+    ])
+    def test_raw_sql_column_tokens(self, sql, expected) -> None:
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content=sql)
+        assert len(NonNullRule().evaluate(m)) == expected
+
+    def test_raw_sql_long_statement_without_semicolon(self) -> None:
+        sql = "ALTER TABLE users ADD COLUMN age INTEGER NOT NULL " + "x " * 50_000
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content=sql)
+        assert len(NonNullRule().evaluate(m)) == 1
+
     def test_alembic_nullable_false(self) -> None:
         m = MigrationInfo(migration_id="abc", app_label="alembic", sql_content=ALEMBIC_REVISION_002)
         assert len(NonNullRule().evaluate(m)) >= 1
@@ -95,10 +130,27 @@ class TestTypeChangeRule:
         m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users ALTER COLUMN age SET DATA TYPE BIGINT;")
         assert len(TypeChangeRule().evaluate(m)) >= 1
 
+    @pytest.mark.parametrize("sql, expected", [
+        ("ALTER TABLE users ALTER COLUMN größe TYPE BIGINT;", 1),
+        ("ALTER TABLE users ALTER COLUMN name TYPE VARCHAR(100);", 1),
+        ('ALTER TABLE users ALTER COLUMN "name" TYPE BIGINT;', 0),
+    ])
+    def test_raw_sql_column_tokens(self, sql, expected) -> None:
+        m = MigrationInfo(migration_id="raw", app_label="test", sql_content=sql)
+        assert len(TypeChangeRule().evaluate(m)) == expected
+
     def test_violation_is_warning_severity(self) -> None:
         m = MigrationInfo(migration_id="raw", app_label="test", sql_content="ALTER TABLE users ALTER COLUMN age TYPE BIGINT;")
         assert all(v.severity.value == "WARNING" for v in TypeChangeRule().evaluate(m))
 
+    def test_violations_follow_file_order(self) -> None:
+        m = MigrationInfo(migration_id="mixed", app_label="test", sql_content=(
+            "migrations.AlterField(model_name='User', name='age')\n"
+            "ALTER TABLE users ALTER COLUMN age TYPE BIGINT;\n"
+            "op.alter_column('users', 'age', type_=sa.BigInteger())\n"
+        ))
+        assert [v.line_hint for v in TypeChangeRule().evaluate(m)] == [1, 2, 3]
+
 
 class TestMultipleHeadsRule:
     def test_no_violation_single_head(self) -> None:
@@ -115,3 +167,59 @@ class TestMultipleHeadsRule:
 
     def test_per_file_evaluate_is_noop(self, sample_migration_info) -> None:
         assert MultipleHeadsRule().evaluate(sample_migration_info) == []
+
+
+class TestScanner:
+    RULES = [DropTableRule(), DropColumnRule(), NonNullRule(), TypeChangeRule(), MultipleHeadsRule()]
+
+    def test_matches_direct_evaluation(self) -> None:
+        migrations = [
+            MigrationInfo(migration_id=str(i), app_label="t", sql_content=c)
+            for i, c in enumerate([DJANGO_MIGRATION_0001, DJANGO_MIGRATION_DROP, DJANGO_MIGRATION_ALTER,
+                                   ALEMBIC_REVISION_002, ALEMBIC_REVISION_DROP, ALEMBIC_REVISION_ALTER])
+        ]
+        expected = [v for rule in self.RULES for m in migrations for v in rule.evaluate(m)]
+        assert scan_all(migrations, self.RULES) == expected and expected
+
+    def test_untriggered_rule_not_evaluated(self) -> None:
+        class Exploding(DropTableRule):
+            def iter_violations(self, migration):
+                raise AssertionError("should have been filtered out")
+        m = MigrationInfo(migration_id="raw", app_label="t", sql_content="ALTER TABLE a DROP COLUMN b;")
+        assert [v.rule_id for v in scan_all([m], [Exploding(), DropColumnRule()])] == ["drop-column"]
+
+    def test_overridden_evaluate_is_used(self) -> None:
+        class Silenced(DropTableRule):
+            def evaluate(self, migration):
+                return []
+        m = MigrationInfo(migration_id="raw", app_label="t", sql_content="DROP TABLE users;")
+        assert scan_all([m], [Silenced()]) == []
+
+    def test_evaluate_only_subclass(self) -> None:
+        class Legacy(BaseRule):
+            rule_id = "legacy"
+
+            def evaluate(self, migration):
+                return DropTableRule().evaluate(migration)
+        m = MigrationInfo(migration_id="raw", app_label="t", sql_content="DROP TABLE users;")
+        assert len(list(Legacy().iter_violations(m))) == 1 and len(scan_all([m], [Legacy()])) == 1
+
+    def test_rule_must_override_evaluate_or_iter_violations(self) -> None:
+        with pytest.raises(TypeError, match="must override"):
+            class Empty(BaseRule):
+                rule_id = "empty"
+
+    def test_trigger_does_not_span_migrations(self) -> None:
+        migrations = [
+            MigrationInfo(migration_id="a", app_label="t", sql_content="-- DROP"),
+            MigrationInfo(migration_id="b", app_label="t", sql_content="TABLE users;"),
+            MigrationInfo(migration_id="c", app_label="t", sql_content="DROP TABLE users;"),
+        ]
+        assert [v.line_hint for v in scan_all(migrations, [DropTableRule()])] == [1]
+
+    def test_identical_content_keeps_each_file_path(self) -> None:
+        migrations = [
+            MigrationInfo(migration_id=name, app_label="t", sql_content="ALTER TABLE a DROP COLUMN b;", file_path=Path(name))
+            for name in ("a/0001.py", "b/0001.py")
+        ]
+        assert [v.file_path for v in scan_all(migrations, self.RULES)] == [str(Path("a/0001.py")), str(Path("b/0001.py"))]